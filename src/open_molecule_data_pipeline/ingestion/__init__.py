@@ -1,21 +1,67 @@
 """Ingestion package exposing SMILES source connectors and orchestration tools."""
 
-from .chembl import ChEMBLConfig, ChEMBLConnector
-from .chemspider import ChemSpiderConfig, ChemSpiderConnector
-from .common import (
-    BaseConnector,
-    BaseHttpConnector,
-    CheckpointManager,
-    HttpSourceConfig,
-    IngestionCheckpoint,
-    IngestionPage,
-    MoleculeRecord,
-    NDJSONWriter,
-    SourceConfig,
-)
-from .pubchem import PubChemConfig, PubChemConnector
-from .runner import IngestionJobConfig, SourceDefinition, load_config, run_ingestion
-from .zinc import ZincConfig, ZincConnector
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .chembl import ChEMBLConfig, ChEMBLConnector
+    from .chemspider import ChemSpiderConfig, ChemSpiderConnector
+    from .common import (
+        BaseConnector,
+        BaseHttpConnector,
+        CheckpointManager,
+        HttpSourceConfig,
+        IngestionCheckpoint,
+        IngestionPage,
+        MoleculeRecord,
+        NDJSONWriter,
+        SourceConfig,
+    )
+    from .pubchem import PubChemConfig, PubChemConnector
+    from .runner import IngestionJobConfig, SourceDefinition, load_config, run_ingestion
+    from .zinc import ZincConfig, ZincConnector
+
+# Submodules are imported on first attribute access so that lightweight entry
+# points (``smiles --help``) do not pay for pydantic, httpx and every connector.
+_EXPORTS: dict[str, str] = {
+    "BaseConnector": "common",
+    "BaseHttpConnector": "common",
+    "CheckpointManager": "common",
+    "HttpSourceConfig": "common",
+    "IngestionCheckpoint": "common",
+    "IngestionJobConfig": "runner",
+    "IngestionPage": "common",
+    "MoleculeRecord": "common",
+    "NDJSONWriter": "common",
+    "SourceConfig": "common",
+    "SourceDefinition": "runner",
+    "load_config": "runner",
+    "run_ingestion": "runner",
+    "ChEMBLConfig": "chembl",
+    "ChEMBLConnector": "chembl",
+    "ChemSpiderConfig": "chemspider",
+    "ChemSpiderConnector": "chemspider",
+    "PubChemConfig": "pubchem",
+    "PubChemConnector": "pubchem",
+    "ZincConfig": "zinc",
+    "ZincConnector": "zinc",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     "BaseConnector",
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import subprocess
+import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Sequence
+from typing import Callable, Mapping, Sequence
 
 Runner = Callable[[Sequence[str]], object]
 
@@ -19,6 +20,8 @@ class Aria2Options:
     min_split_size: str = "1M"
     max_tries: int = 5
     retry_wait: int = 2
+    summary_interval: int = 0
+    file_allocation: str | None = None
     extra_args: tuple[str, ...] = field(default_factory=tuple)
 
     def to_args(self) -> list[str]:
@@ -30,11 +33,37 @@ class Aria2Options:
             f"--min-split-size={self.min_split_size}",
             f"--max-tries={self.max_tries}",
             f"--retry-wait={self.retry_wait}",
+            f"--summary-interval={self.summary_interval}",
         ]
+        if self.file_allocation is not None:
+            args.append(f"--file-allocation={self.file_allocation}")
         args.extend(self.extra_args)
         return args
 
 
+_BASE_ARGS: tuple[str, ...] = (
+    "aria2c",
+    "--continue=true",
+    "--auto-file-renaming=false",
+    "--allow-overwrite=true",
+)
+
+
+def is_download_complete(path: Path) -> bool:
+    """Return ``True`` if *path* holds a finished download.
+
+    aria2 keeps a ``<name>.aria2`` control file next to a transfer until it
+    completes. A non-empty target with that file present is a partial download,
+    and passing it back to :command:`aria2c` resumes it.
+    """
+
+    return (
+        path.exists()
+        and path.stat().st_size > 0
+        and not path.with_name(f"{path.name}.aria2").exists()
+    )
+
+
 def _default_runner(command: Sequence[str]) -> subprocess.CompletedProcess[bytes]:
     return subprocess.run(command, check=True, capture_output=True)
 
@@ -65,8 +94,9 @@ def download_with_aria2(
     username / password:
         Optional HTTP basic authentication credentials.
     skip_existing:
-        If ``True`` (the default) and *output_path* exists with a positive size
-        and no checksum validation is requested, the download is skipped.
+        If ``True`` (the default), *output_path* is a complete download (see
+        :func:`is_download_complete`) and no checksum validation is requested,
+        the download is skipped.
     options:
         Advanced :class:`Aria2Options` controlling concurrency and retries.
     runner:
@@ -78,14 +108,11 @@ def download_with_aria2(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    if skip_existing and output_path.exists() and output_path.stat().st_size > 0 and checksum is None:
+    if skip_existing and is_download_complete(output_path) and checksum is None:
         return
 
     command: list[str] = [
-        "aria2c",
-        "--continue=true",
-        "--auto-file-renaming=false",
-        "--allow-overwrite=true",
+        *_BASE_ARGS,
         f"--dir={output_path.parent}",
         f"--out={output_path.name}",
     ]
@@ -96,7 +123,10 @@ def download_with_aria2(
     if checksum is not None:
         algorithm, value = checksum
         command.append(f"--checksum={algorithm}={value}")
-        command.append("--check-integrity=true")
+        # aria2 verifies fresh transfers against --checksum on completion; an
+        # integrity pass only adds a second full read for files already on disk.
+        if output_path.exists():
+            command.append("--check-integrity=true")
 
     if username:
         command.extend(["--http-user", username])
@@ -109,5 +139,93 @@ def download_with_aria2(
     exec_runner(command)
 
 
-__all__ = ["Aria2Options", "download_with_aria2"]
+def download_many_with_aria2(
+    downloads: Sequence[tuple[str, Path]],
+    *,
+    max_concurrent_downloads: int = 5,
+    checksums: Mapping[Path, tuple[str, str]] | None = None,
+    username: str | None = None,
+    password: str | None = None,
+    skip_existing: bool = True,
+    options: Aria2Options | None = None,
+    runner: Runner | None = None,
+) -> None:
+    """Download several ``(url, output_path)`` pairs with one :command:`aria2c` process.
+
+    The pairs are written to an aria2 input file so transfers run concurrently
+    without paying process start-up per file. A non-zero exit status is raised
+    by the default runner when any transfer fails; files that did complete are
+    left in place.
+
+    Parameters
+    ----------
+    downloads:
+        URL and target path pairs. Parent directories are created as needed.
+    max_concurrent_downloads:
+        Number of files aria2 transfers in parallel (``--max-concurrent-downloads``).
+    checksums:
+        Optional ``(algorithm, value)`` tuples keyed by output path. Matching
+        transfers are verified with ``checksum``; ``check-integrity`` is only
+        added for targets that already exist on disk.
+    username / password:
+        Optional HTTP basic authentication credentials shared by every transfer.
+    skip_existing:
+        If ``True`` (the default) targets that are complete downloads and have
+        no entry in *checksums* are not requested again; partial ones are
+        resumed. Targets with a checksum are always handed to aria2 so the
+        existing file is verified, as in :func:`download_with_aria2`.
+    options:
+        Advanced :class:`Aria2Options` applied to every transfer.
+    runner:
+        Callable executing the constructed command, as for
+        :func:`download_with_aria2`.
+    """
+
+    pending = [
+        (url, Path(output_path))
+        for url, output_path in downloads
+        if not (
+            skip_existing
+            and is_download_complete(Path(output_path))
+            and not (checksums and Path(output_path) in checksums)
+        )
+    ]
+    if not pending:
+        return
+
+    lines: list[str] = []
+    for url, output_path in pending:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        lines.extend([url, f"  dir={output_path.parent}", f"  out={output_path.name}"])
+        checksum = checksums.get(output_path) if checksums else None
+        if checksum is not None:
+            algorithm, value = checksum
+            lines.append(f"  checksum={algorithm}={value}")
+            if output_path.exists():
+                lines.append("  check-integrity=true")
+
+    opts = options or Aria2Options()
+    exec_runner = runner or _default_runner
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_file = Path(tmp_dir) / "downloads.txt"
+        input_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        command = [
+            *_BASE_ARGS,
+            f"--input-file={input_file}",
+            f"--max-concurrent-downloads={max_concurrent_downloads}",
+            *opts.to_args(),
+        ]
+        if username:
+            command.extend(["--http-user", username])
+        if password:
+            command.extend(["--http-password", password])
+        exec_runner(command)
+
+
+__all__ = [
+    "Aria2Options",
+    "download_many_with_aria2",
+    "download_with_aria2",
+    "is_download_complete",
+]
 
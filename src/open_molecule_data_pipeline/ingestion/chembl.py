@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import os
 import subprocess
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Callable, Iterator, Mapping
+from typing import Callable, Iterator
+from urllib.parse import urlsplit
 
 from pydantic import Field
 
-from .aria2 import Aria2Options, download_with_aria2
+from .aria2 import (
+    Aria2Options,
+    download_many_with_aria2,
+    download_with_aria2,
+    is_download_complete,
+)
 from .common import (
     BaseConnector,
     CheckpointManager,
@@ -17,7 +25,7 @@ from .common import (
     MoleculeRecord,
     SourceConfig,
 )
-from .sdf import iter_sdf_records
+from .sdf import FieldTags, build_field_tags, iter_archive_fields
 from ..logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -29,6 +37,25 @@ class _ChEMBLEntry:
     url: str
 
 
+@lru_cache(maxsize=32)
+def _load_link_file(path: Path, mtime_ns: int, size: int) -> tuple[_ChEMBLEntry, ...]:
+    """Parse *path*, memoised on its modification time and size."""
+
+    entries: list[_ChEMBLEntry] = []
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        for url in map(str.strip, handle):
+            if not url or url.startswith("#"):
+                continue
+            filename = urlsplit(url).path.rsplit("/", 1)[-1]
+            if not filename:
+                raise ValueError(f"Unable to determine filename for URL: {url}")
+            entries.append(_ChEMBLEntry(filename=filename, url=url))
+
+    if not entries:
+        raise ValueError(f"No download URLs found in {path}")
+    return tuple(entries)
+
+
 class ChEMBLConfig(SourceConfig):
     """Configuration for downloading ChEMBL SDF exports."""
 
@@ -50,6 +77,19 @@ class ChEMBLConfig(SourceConfig):
         description="Metadata fields retained for backwards compatibility.",
     )
     aria2_options: dict[str, str | int | float | bool] = Field(default_factory=dict)
+    max_concurrent_downloads: int = Field(
+        default=4,
+        gt=0,
+        description="Number of archives aria2 downloads in parallel.",
+    )
+    parse_workers: int = Field(
+        default=1,
+        gt=0,
+        description=(
+            "Worker processes parsing upcoming archives ahead of the current one. "
+            "Each in-flight archive is held in memory while it waits."
+        ),
+    )
 
 
 class ChEMBLConnector(BaseConnector):
@@ -62,12 +102,19 @@ class ChEMBLConnector(BaseConnector):
         config: ChEMBLConfig,
         checkpoint_manager: CheckpointManager,
         aria2_downloader: Callable[..., None] | None = None,
+        aria2_batch_downloader: Callable[..., None] | None = None,
     ) -> None:
         super().__init__(config=config, checkpoint_manager=checkpoint_manager)
         self._download_dir = self._resolve_download_dir()
         self._aria2_downloader = aria2_downloader or download_with_aria2
+        # A custom single-file downloader keeps the per-entry download path.
+        self._aria2_batch_downloader = aria2_batch_downloader or (
+            None if aria2_downloader else download_many_with_aria2
+        )
         self._aria2_options = self._build_aria2_options()
-        self._entries = self._parse_link_file(config.link_file)
+        self._field_tags: FieldTags = build_field_tags(
+            config.identifier_tag, config.smiles_tag, config.metadata_tags
+        )
 
     def _resolve_download_dir(self) -> Path:
         if self.config.download_dir is not None:
@@ -86,24 +133,17 @@ class ChEMBLConnector(BaseConnector):
     def _parse_link_file(self, path: Path) -> list[_ChEMBLEntry]:
         if not path.exists():
             raise FileNotFoundError(f"ChEMBL link file not found: {path}")
+        stat = path.stat()
+        return list(_load_link_file(path.resolve(), stat.st_mtime_ns, stat.st_size))
 
-        entries: list[_ChEMBLEntry] = []
-        for raw_line in path.read_text(encoding="utf-8", errors="replace").splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            filename = Path(line).name
-            if not filename:
-                raise ValueError(f"Unable to determine filename for URL: {line}")
-            entries.append(_ChEMBLEntry(filename=filename, url=line))
-
-        if not entries:
-            raise ValueError(f"No download URLs found in {path}")
-        return entries
+    @cached_property
+    def _entries(self) -> list[_ChEMBLEntry]:
+        # Parsed on first use so completed jobs never touch the link file.
+        return self._parse_link_file(self.config.link_file)
 
     def _ensure_archive(self, entry: _ChEMBLEntry) -> Path | None:
         target = self._download_dir / entry.filename
-        if target.exists() and target.stat().st_size > 0:
+        if is_download_complete(target):
             return target
         try:
             self._aria2_downloader(
@@ -132,6 +172,9 @@ class ChEMBLConnector(BaseConnector):
     def download_archives(self) -> list[Path]:
         """Ensure all referenced archives are present locally."""
 
+        if self._aria2_batch_downloader is not None:
+            return self._download_archives_batched(self._aria2_batch_downloader)
+
         downloaded: list[Path] = []
         for entry in self._entries:
             archive = self._ensure_archive(entry)
@@ -145,40 +188,83 @@ class ChEMBLConnector(BaseConnector):
             downloaded.append(archive)
         return downloaded
 
+    def _local_archive_sizes(self) -> dict[str, int]:
+        """Return ``{filename: size}`` for completed downloads in one directory scan."""
+
+        try:
+            with os.scandir(self._download_dir) as entries:
+                sizes = {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            return {}
+        # Files with an aria2 control file beside them are partial downloads.
+        return {name: size for name, size in sizes.items() if f"{name}.aria2" not in sizes}
+
+    def _download_archives_batched(self, downloader: Callable[..., None]) -> list[Path]:
+        targets = [self._download_dir / entry.filename for entry in self._entries]
+        sizes = self._local_archive_sizes()
+        pending = [
+            (entry.url, target)
+            for entry, target in zip(self._entries, targets, strict=True)
+            if not sizes.get(entry.filename)
+        ]
+        if pending:
+            try:
+                downloader(
+                    pending,
+                    max_concurrent_downloads=self.config.max_concurrent_downloads,
+                    options=self._aria2_options,
+                    skip_existing=True,
+                )
+            except subprocess.CalledProcessError as exc:
+                logger.error(
+                    "ingestion.chembl.download_failed",
+                    source=self.config.name,
+                    files=len(pending),
+                    returncode=exc.returncode,
+                )
+
+            sizes = self._local_archive_sizes()
+
+        downloaded: list[Path] = []
+        for entry, target in zip(self._entries, targets, strict=True):
+            if not sizes.get(entry.filename):
+                logger.warning(
+                    "ingestion.chembl.skip_entry",
+                    source=self.config.name,
+                    url=entry.url,
+                )
+                continue
+            downloaded.append(target)
+        return downloaded
+
     def _resolve_local_archive(self, entry: _ChEMBLEntry) -> Path:
         target = self._download_dir / entry.filename
-        if not target.exists() or target.stat().st_size == 0:
+        if not is_download_complete(target):
             raise FileNotFoundError(
                 f"ChEMBL archive not found: {target}. Run 'smiles download' first."
             )
         return target
 
-    def _build_record(self, properties: Mapping[str, str]) -> MoleculeRecord:
-        identifier = properties.get(self.config.identifier_tag, "").strip()
-        smiles = properties.get(self.config.smiles_tag, "").strip()
-        metadata: dict[str, str] = {
-            key: value
-            for key, value in properties.items()
-            if key not in {self.config.identifier_tag, self.config.smiles_tag}
-        }
-        if self.config.metadata_tags:
-            metadata = {
-                key: metadata[key]
-                for key in self.config.metadata_tags
-                if key in metadata
-            }
-        metadata = {key: value for key, value in metadata.items() if value}
-        return MoleculeRecord(
-            source=self.config.name,
-            identifier=identifier,
-            smiles=smiles,
-            metadata=metadata,
-        )
+    def _iter_archives(
+        self, start_file: int, start_offset: int
+    ) -> Iterator[tuple[int, Iterator[MoleculeRecord]]]:
+        """Yield ``(file_index, records)`` for each archive from *start_file* onwards."""
 
-    def _iter_records(self, entry: _ChEMBLEntry) -> Iterator[MoleculeRecord]:
-        archive = self._resolve_local_archive(entry)
-        for properties in iter_sdf_records(archive):
-            yield self._build_record(properties)
+        entries = self._entries
+        source = self.config.name
+        construct = MoleculeRecord.model_construct
+        for file_index, rows in iter_archive_fields(
+            lambda index: self._resolve_local_archive(entries[index]),
+            range(start_file, len(entries)),
+            start_offset,
+            self._field_tags,
+            workers=self.config.parse_workers,
+        ):
+            # Tag values are already strings; skip per-record pydantic validation.
+            yield file_index, (
+                construct(source=source, identifier=identifier, smiles=smiles, metadata=metadata)
+                for identifier, smiles, metadata in rows
+            )
 
     def fetch_pages(self) -> Iterator[IngestionPage]:
         checkpoint = self._checkpoint_manager.load(self.config.name)
@@ -192,27 +278,24 @@ class ChEMBLConnector(BaseConnector):
             start_file = int(checkpoint.cursor.get("file_index", 0))
             start_offset = int(checkpoint.cursor.get("record_offset", 0))
 
+        batch_size = self.config.batch_size
         batch: list[MoleculeRecord] = []
         entries = self._entries
-        for file_index in range(start_file, len(entries)):
+        for file_index, records in self._iter_archives(start_file, start_offset):
             entry = entries[file_index]
-            record_offset = start_offset if file_index == start_file else 0
-            processed = 0
+            processed = start_offset if file_index == start_file else 0
 
-            for record in self._iter_records(entry):
-                if processed < record_offset:
-                    processed += 1
-                    continue
+            for record in records:
                 batch.append(record)
                 processed += 1
-                if len(batch) >= self.config.batch_size:
+                if len(batch) >= batch_size:
                     next_cursor = {
                         "file_index": file_index,
                         "file_name": entry.filename,
                         "record_offset": processed,
                     }
-                    yield IngestionPage(records=list(batch), next_cursor=next_cursor)
-                    batch.clear()
+                    yield IngestionPage.model_construct(records=batch, next_cursor=next_cursor)
+                    batch = []
 
             start_offset = 0
 
@@ -228,8 +311,8 @@ class ChEMBLConnector(BaseConnector):
                     if file_index + 1 < len(entries)
                     else None
                 )
-                yield IngestionPage(records=list(batch), next_cursor=next_cursor)
-                batch.clear()
+                yield IngestionPage.model_construct(records=batch, next_cursor=next_cursor)
+                batch = []
 
         if not entries:
             yield IngestionPage(records=[], next_cursor=None)
@@ -7,7 +7,6 @@ from pathlib import Path
 import click
 
 from ..logging_utils import get_logger
-from .runner import load_config, run_ingestion
 
 logger = get_logger(__name__)
 
@@ -23,6 +22,9 @@ logger = get_logger(__name__)
 def download_command(config_path: Path) -> None:
     """Download raw archives referenced in *config_path*."""
 
+    # Deferred so ``--help`` does not import every connector.
+    from .runner import load_config, run_ingestion
+
     job_config = load_config(config_path)
     logger.info("download.start", sources=[source.name for source in job_config.sources])
     run_ingestion(job_config, mode="download")
@@ -40,6 +42,8 @@ def download_command(config_path: Path) -> None:
 def ingest_command(config_path: Path) -> None:
     """Run the SMILES ingestion job defined in *config_path*."""
 
+    from .runner import load_config, run_ingestion
+
     job_config = load_config(config_path)
     logger.info("ingestion.start", sources=[source.name for source in job_config.sources])
     run_ingestion(job_config, mode="parse")
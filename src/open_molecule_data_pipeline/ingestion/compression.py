@@ -0,0 +1,96 @@
+"""Compression backend selection shared by archive readers and batch writers."""
+
+from __future__ import annotations
+
+import gzip
+import io
+from importlib import import_module
+from pathlib import Path
+from types import ModuleType
+from typing import IO, cast
+
+# Optional backends from the ``fast`` extra. They are imported by name so the
+# module types check the same whether or not the packages are installed.
+try:  # pragma: no cover - optional dependency branch
+    _isal_gzip: ModuleType | None = import_module("isal.igzip")
+except ImportError:  # pragma: no cover - stdlib fallback
+    _isal_gzip = None
+
+try:  # pragma: no cover - optional dependency branch (isal >= 1.5)
+    _isal_threaded: ModuleType | None = import_module("isal.igzip_threaded")
+except ImportError:  # pragma: no cover - single-threaded fallback
+    _isal_threaded = None
+
+try:  # pragma: no cover - optional dependency branch
+    _zstd: ModuleType | None = import_module("zstandard")
+except ImportError:  # pragma: no cover - zstd output unavailable
+    _zstd = None
+
+# ISA-L only implements compression levels 0-3.
+_ISAL_MAX_COMPRESSLEVEL = 3
+
+
+def open_gzip_writer(path: Path, compresslevel: int) -> gzip.GzipFile:
+    """Open *path* for binary gzip output using the fastest available backend.
+
+    Parameters
+    ----------
+    path:
+        Destination file, truncated if it already exists.
+    compresslevel:
+        Deflate level. Values above what ISA-L supports are clamped when the
+        optional ``isal`` package is installed; otherwise stdlib :mod:`gzip`
+        is used unchanged.
+    """
+
+    if _isal_gzip is not None:
+        level = min(compresslevel, _ISAL_MAX_COMPRESSLEVEL)
+        return _isal_gzip.IGzipFile(path, mode="wb", compresslevel=level)
+    return gzip.GzipFile(path, mode="wb", compresslevel=compresslevel)
+
+
+def open_gzip_reader(path: Path) -> IO[bytes]:
+    """Open *path* for binary gzip input using the fastest available backend.
+
+    Parameters
+    ----------
+    path:
+        Gzip-compressed file to read. ISA-L inflate is used when the optional
+        ``isal`` package is installed, running on a background thread where
+        supported so decompression overlaps with the caller's parsing;
+        otherwise stdlib :mod:`gzip`. The stream is not seekable.
+    """
+
+    stream: object
+    if _isal_threaded is not None:
+        stream = _isal_threaded.open(path, "rb", threads=1)
+    elif _isal_gzip is not None:
+        stream = _isal_gzip.IGzipFile(path, mode="rb")
+    else:
+        stream = gzip.GzipFile(path, mode="rb")
+    return cast(IO[bytes], stream)
+
+
+def open_zstd_writer(path: Path, compresslevel: int) -> io.RawIOBase:
+    """Open *path* for binary zstd output using the optional ``zstandard`` package.
+
+    Parameters
+    ----------
+    path:
+        Destination file, truncated if it already exists.
+    compresslevel:
+        Zstandard level. Compression runs on zstd's own worker threads.
+
+    Raises
+    ------
+    RuntimeError
+        If ``zstandard`` is not installed.
+    """
+
+    if _zstd is None:
+        raise RuntimeError("zstd output requires 'zstandard' (install the 'fast' extra)")
+    compressor = _zstd.ZstdCompressor(level=compresslevel, threads=-1)
+    return cast(io.RawIOBase, compressor.stream_writer(path.open("wb"), closefd=True))
+
+
+__all__ = ["open_gzip_reader", "open_gzip_writer", "open_zstd_writer"]
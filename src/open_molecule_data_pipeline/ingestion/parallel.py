@@ -0,0 +1,72 @@
+"""Ordered look-ahead parsing of archives in worker processes."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import get_context
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def iter_parsed_ahead(
+    indices: Iterable[int],
+    prepare: Callable[[int], tuple[Any, ...] | None],
+    parse: Callable[..., T],
+    workers: int,
+) -> Iterator[tuple[int, T | None]]:
+    """Yield ``(index, parse(*prepare(index)))`` for each index, in order.
+
+    Parameters
+    ----------
+    indices:
+        Archive indices to process.
+    prepare:
+        Runs in the calling process as each index is queued, up to *workers*
+        ahead of the one being consumed, and returns the arguments for
+        *parse*. Returning ``None`` skips the index, which is yielded with a
+        ``None`` result. Errors it raises (for example a missing archive) are
+        re-raised only when that index is reached, so earlier results are
+        still yielded first.
+    parse:
+        Module-level function run in a worker process.
+    workers:
+        Number of worker processes, and of indices queued ahead.
+    """
+
+    # Spawn rather than fork: connectors run on runner threads alongside the
+    # prefetch thread and HTTP clients, whose held locks a forked child would
+    # inherit.
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+    try:
+        pending: deque[tuple[int, Future[T] | None]] = deque()
+        remaining = iter(indices)
+
+        def submit(index: int) -> None:
+            future: Future[T] | None
+            try:
+                args = prepare(index)
+            except Exception as exc:
+                future = Future()
+                future.set_exception(exc)
+            else:
+                future = None if args is None else pool.submit(parse, *args)
+            pending.append((index, future))
+
+        for index in islice(remaining, workers):
+            submit(index)
+        while pending:
+            index, future = pending.popleft()
+            result = future.result() if future is not None else None
+            next_index = next(remaining, None)
+            if next_index is not None:
+                submit(next_index)
+            yield index, result
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+__all__ = ["iter_parsed_ahead"]
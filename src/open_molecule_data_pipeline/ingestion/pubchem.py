@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Iterator, Mapping
+from typing import Callable, Iterator
 
 from pydantic import Field
 
 from ..logging_utils import get_logger
-from .aria2 import Aria2Options, download_with_aria2
+from .aria2 import (
+    Aria2Options,
+    download_many_with_aria2,
+    download_with_aria2,
+    is_download_complete,
+)
 from .common import (
     BaseConnector,
     CheckpointManager,
@@ -18,11 +25,19 @@ from .common import (
     MoleculeRecord,
     SourceConfig,
 )
-from .sdf import iter_sdf_records
+from .sdf import FieldTags, build_field_tags, iter_archive_fields
 
 logger = get_logger(__name__)
 
 
+def _verify(path: Path, algorithm: str, expected: str) -> bool:
+    """Return ``True`` if the *algorithm* digest of *path* equals *expected*."""
+
+    with path.open("rb") as handle:
+        digest = hashlib.file_digest(handle, algorithm).hexdigest()
+    return digest.lower() == expected.lower()
+
+
 @dataclass(frozen=True)
 class _PubChemEntry:
     filename: str
@@ -31,6 +46,51 @@ class _PubChemEntry:
     checksum_algorithm: str | None
 
 
+@lru_cache(maxsize=32)
+def _load_link_file(
+    path: Path,
+    mtime_ns: int,
+    size: int,
+    checksum_suffix: str | None,
+    checksum_algorithm: str | None,
+) -> tuple[_PubChemEntry, ...]:
+    """Parse *path*, memoised on its modification time and size."""
+
+    entries: list[_PubChemEntry] = []
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        for line_number, raw_line in enumerate(handle, start=1):
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            url = line.split()[0]
+            filename = Path(url).name
+            if not filename:
+                raise ValueError(
+                    "Unable to determine filename for PubChem URL on line "
+                    f"{line_number}: {line}"
+                )
+
+            checksum_url: str | None = None
+            checksum_alg: str | None = None
+            if checksum_suffix and checksum_algorithm:
+                checksum_url = f"{url}{checksum_suffix}"
+                checksum_alg = checksum_algorithm
+
+            entries.append(
+                _PubChemEntry(
+                    filename=filename,
+                    url=url,
+                    checksum_url=checksum_url,
+                    checksum_algorithm=checksum_alg,
+                )
+            )
+
+    if not entries:
+        raise ValueError(f"No SDF URLs discovered in link file: {path}")
+    return tuple(entries)
+
+
 class PubChemConfig(SourceConfig):
     """Configuration for downloading PubChem SDF bundles via :command:`aria2c`."""
 
@@ -66,6 +126,26 @@ class PubChemConfig(SourceConfig):
         description="Metadata fields retained for backwards compatibility.",
     )
     aria2_options: dict[str, str | int | float | bool] = Field(default_factory=dict)
+    max_concurrent_downloads: int = Field(
+        default=16,
+        gt=0,
+        description="Number of archives aria2 downloads in parallel.",
+    )
+    parse_workers: int = Field(
+        default=1,
+        gt=0,
+        description=(
+            "Worker processes parsing upcoming archives ahead of the current one. "
+            "Each in-flight archive is held in memory while it waits."
+        ),
+    )
+    verify_existing: bool = Field(
+        default=False,
+        description=(
+            "If True, archives already on disk are hashed against their cached "
+            "checksum file before being reused; mismatches are downloaded again."
+        ),
+    )
 
 
 class PubChemConnector(BaseConnector):
@@ -73,17 +153,35 @@ class PubChemConnector(BaseConnector):
 
     config: PubChemConfig
 
+    # Many files with fewer connections each suits the PubChem mirrors better
+    # than a few heavily split transfers; user-supplied options still win.
+    ARIA2_DEFAULTS: dict[str, str | int | float | bool] = {
+        "connections": 8,
+        "split": 16,
+        "min_split_size": "1M",
+    }
+
     def __init__(
         self,
         config: PubChemConfig,
         checkpoint_manager: CheckpointManager,
         aria2_downloader: Callable[..., None] | None = None,
+        aria2_batch_downloader: Callable[..., None] | None = None,
     ) -> None:
         super().__init__(config=config, checkpoint_manager=checkpoint_manager)
         self._download_dir = self._resolve_download_dir()
         self._aria2_downloader = aria2_downloader or download_with_aria2
+        # A custom single-file downloader keeps the per-entry download path.
+        self._aria2_batch_downloader = aria2_batch_downloader or (
+            None if aria2_downloader else download_many_with_aria2
+        )
         self._aria2_options = self._build_aria2_options()
         self._entries = self._parse_link_file(config.link_file)
+        # (filename, mtime_ns, size) of archives whose checksum already matched.
+        self._verified: set[tuple[str, int, int]] = set()
+        self._field_tags: FieldTags = build_field_tags(
+            config.identifier_tag, config.smiles_tag, config.metadata_tags
+        )
 
 
     def _resolve_download_dir(self) -> Path:
@@ -93,9 +191,7 @@ class PubChemConnector(BaseConnector):
 
 
     def _build_aria2_options(self) -> Aria2Options:
-        options = self.config.aria2_options
-        if not options:
-            return Aria2Options()
+        options = {**self.ARIA2_DEFAULTS, **self.config.aria2_options}
         try:
             return Aria2Options(**options)
         except TypeError as exc:  # pragma: no cover - validation guard
@@ -104,43 +200,18 @@ class PubChemConnector(BaseConnector):
     def _parse_link_file(self, path: Path) -> list[_PubChemEntry]:
         if not path.exists():
             raise FileNotFoundError(f"PubChem link file not found: {path}")
-
-        entries: list[_PubChemEntry] = []
+        stat = path.stat()
         checksum_suffix = self.config.checksum_suffix
         checksum_algorithm = self.config.checksum_algorithm if checksum_suffix else None
-
-        for line_number, raw_line in enumerate(
-            path.read_text(encoding="utf-8", errors="replace").splitlines(), start=1
-        ):
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            url = line.split()[0]
-            filename = Path(url).name
-            if not filename:
-                raise ValueError(
-                    f"Unable to determine filename for PubChem URL on line {line_number}: {line}"
-                )
-
-            checksum_url: str | None = None
-            checksum_alg: str | None = None
-            if checksum_suffix and checksum_algorithm:
-                checksum_url = f"{url}{checksum_suffix}"
-                checksum_alg = checksum_algorithm
-
-            entries.append(
-                _PubChemEntry(
-                    filename=filename,
-                    url=url,
-                    checksum_url=checksum_url,
-                    checksum_algorithm=checksum_alg,
-                )
+        return list(
+            _load_link_file(
+                path.resolve(),
+                stat.st_mtime_ns,
+                stat.st_size,
+                checksum_suffix,
+                checksum_algorithm,
             )
-
-        if not entries:
-            raise ValueError(f"No SDF URLs discovered in link file: {path}")
-        return entries
+        )
 
     def _checksum_path(self, entry: _PubChemEntry) -> Path:
         suffix = self.config.checksum_suffix or ""
@@ -150,7 +221,7 @@ class PubChemConnector(BaseConnector):
         if not entry.checksum_url or not entry.checksum_algorithm:
             return None
         checksum_path = self._checksum_path(entry)
-        if not checksum_path.exists() or checksum_path.stat().st_size == 0:
+        if not is_download_complete(checksum_path):
             checksum_path.parent.mkdir(parents=True, exist_ok=True)
             self._aria2_downloader(
                 entry.checksum_url,
@@ -158,16 +229,48 @@ class PubChemConnector(BaseConnector):
                 options=self._aria2_options,
                 skip_existing=False,
             )
+        return self._read_checksum(entry)
+
+    def _read_checksum(self, entry: _PubChemEntry) -> tuple[str, str] | None:
+        if not entry.checksum_algorithm:
+            return None
+        checksum_path = self._checksum_path(entry)
         content = checksum_path.read_text(encoding="utf-8", errors="ignore").strip()
         if not content:
             raise ValueError(f"Checksum file is empty: {checksum_path}")
         value = content.split()[0]
         return (entry.checksum_algorithm, value)
 
+    def _is_cached(self, entry: _PubChemEntry, target: Path) -> bool:
+        if not is_download_complete(target):
+            return False
+        if not self.config.verify_existing or not entry.checksum_url:
+            return True
+        # Only checksums already on disk are used; fetching one would cost an
+        # aria2c call per archive, which this fast path exists to avoid.
+        if not is_download_complete(self._checksum_path(entry)):
+            return True
+        checksum = self._read_checksum(entry)
+        if checksum is None:
+            return True
+        stat = target.stat()
+        key = (entry.filename, stat.st_mtime_ns, stat.st_size)
+        if key in self._verified:
+            return True
+        if _verify(target, *checksum):
+            self._verified.add(key)
+            return True
+        logger.warning(
+            "ingestion.pubchem.checksum_mismatch",
+            source=self.config.name,
+            file=str(target),
+        )
+        return False
+
     def _ensure_archive(self, entry: _PubChemEntry) -> Path | None:
         target = self._download_dir / entry.filename
         target.parent.mkdir(parents=True, exist_ok=True)
-        if target.exists() and target.stat().st_size > 0:
+        if self._is_cached(entry, target):
             return target
         checksum = self._load_checksum(entry)
         skip_existing = checksum is None
@@ -196,6 +299,9 @@ class PubChemConnector(BaseConnector):
     def download_archives(self) -> list[Path]:
         """Ensure all referenced archives and checksums are present locally."""
 
+        if self._aria2_batch_downloader is not None:
+            return self._download_archives_batched(self._aria2_batch_downloader)
+
         downloaded: list[Path] = []
         for entry in self._entries:
             archive = self._ensure_archive(entry)
@@ -209,40 +315,101 @@ class PubChemConnector(BaseConnector):
             downloaded.append(archive)
         return downloaded
 
+    def _run_batch(
+        self,
+        downloader: Callable[..., None],
+        downloads: list[tuple[str, Path]],
+        **kwargs: object,
+    ) -> None:
+        if not downloads:
+            return
+        try:
+            downloader(
+                downloads,
+                max_concurrent_downloads=self.config.max_concurrent_downloads,
+                options=self._aria2_options,
+                # Callers pass only files that need fetching.
+                skip_existing=False,
+                **kwargs,
+            )
+        except subprocess.CalledProcessError as exc:
+            logger.error(
+                "ingestion.pubchem.download_failed",
+                source=self.config.name,
+                files=len(downloads),
+                returncode=exc.returncode,
+            )
+
+    def _download_archives_batched(self, downloader: Callable[..., None]) -> list[Path]:
+        targets = [self._download_dir / entry.filename for entry in self._entries]
+        missing = [
+            (entry, target)
+            for entry, target in zip(self._entries, targets, strict=True)
+            if not self._is_cached(entry, target)
+        ]
+
+        # Checksums are fetched first so every archive is verified in one aria2c run.
+        self._run_batch(
+            downloader,
+            [
+                (entry.checksum_url, self._checksum_path(entry))
+                for entry, _ in missing
+                if entry.checksum_url and not is_download_complete(self._checksum_path(entry))
+            ],
+        )
+
+        pending: list[tuple[str, Path]] = []
+        checksums: dict[Path, tuple[str, str]] = {}
+        for entry, target in missing:
+            if entry.checksum_url:
+                if not is_download_complete(self._checksum_path(entry)):
+                    continue
+                checksum = self._read_checksum(entry)
+                if checksum is not None:
+                    checksums[target] = checksum
+            pending.append((entry.url, target))
+        self._run_batch(downloader, pending, checksums=checksums)
+
+        downloaded: list[Path] = []
+        for entry, target in zip(self._entries, targets, strict=True):
+            if not is_download_complete(target):
+                logger.warning(
+                    "ingestion.pubchem.skip_entry",
+                    source=self.config.name,
+                    url=entry.url,
+                )
+                continue
+            downloaded.append(target)
+        return downloaded
+
     def _resolve_local_archive(self, entry: _PubChemEntry) -> Path:
         target = self._download_dir / entry.filename
-        if not target.exists() or target.stat().st_size == 0:
+        if not is_download_complete(target):
             raise FileNotFoundError(
                 f"PubChem archive not found: {target}. Run 'smiles download' first."
             )
         return target
 
-    def _build_record(self, properties: Mapping[str, str]) -> MoleculeRecord:
-        identifier = properties.get(self.config.identifier_tag, "").strip()
-        smiles = properties.get(self.config.smiles_tag, "").strip()
-        metadata: dict[str, str] = {
-            key: value
-            for key, value in properties.items()
-            if key not in {self.config.identifier_tag, self.config.smiles_tag}
-        }
-        if self.config.metadata_tags:
-            metadata = {
-                key: metadata[key]
-                for key in self.config.metadata_tags
-                if key in metadata
-            }
-        metadata = {key: value for key, value in metadata.items() if value}
-        return MoleculeRecord(
-            source=self.config.name,
-            identifier=identifier,
-            smiles=smiles,
-            metadata=metadata,
-        )
+    def _iter_archives(
+        self, start_file: int, start_offset: int
+    ) -> Iterator[tuple[int, Iterator[MoleculeRecord]]]:
+        """Yield ``(file_index, records)`` for each archive from *start_file* onwards."""
 
-    def _iter_records(self, entry: _PubChemEntry) -> Iterator[MoleculeRecord]:
-        archive = self._resolve_local_archive(entry)
-        for properties in iter_sdf_records(archive):
-            yield self._build_record(properties)
+        entries = self._entries
+        source = self.config.name
+        construct = MoleculeRecord.model_construct
+        for file_index, rows in iter_archive_fields(
+            lambda index: self._resolve_local_archive(entries[index]),
+            range(start_file, len(entries)),
+            start_offset,
+            self._field_tags,
+            workers=self.config.parse_workers,
+        ):
+            # Tag values are already stripped strings; skip pydantic validation.
+            yield file_index, (
+                construct(source=source, identifier=identifier, smiles=smiles, metadata=metadata)
+                for identifier, smiles, metadata in rows
+            )
 
     def fetch_pages(self) -> Iterator[IngestionPage]:
         checkpoint = self._checkpoint_manager.load(self.config.name)
@@ -256,27 +423,24 @@ class PubChemConnector(BaseConnector):
             start_file = int(checkpoint.cursor.get("file_index", 0))
             start_offset = int(checkpoint.cursor.get("record_offset", 0))
 
+        batch_size = self.config.batch_size
         batch: list[MoleculeRecord] = []
         entries = self._entries
-        for file_index in range(start_file, len(entries)):
+        for file_index, records in self._iter_archives(start_file, start_offset):
             entry = entries[file_index]
-            record_offset = start_offset if file_index == start_file else 0
-            processed = 0
+            processed = start_offset if file_index == start_file else 0
 
-            for record in self._iter_records(entry):
-                if processed < record_offset:
-                    processed += 1
-                    continue
+            for record in records:
                 batch.append(record)
                 processed += 1
-                if len(batch) >= self.config.batch_size:
+                if len(batch) >= batch_size:
                     next_cursor = {
                         "file_index": file_index,
                         "file_name": entry.filename,
                         "record_offset": processed,
                     }
-                    yield IngestionPage(records=list(batch), next_cursor=next_cursor)
-                    batch.clear()
+                    yield IngestionPage.model_construct(records=batch, next_cursor=next_cursor)
+                    batch = []
 
             start_offset = 0
 
@@ -292,8 +456,8 @@ class PubChemConnector(BaseConnector):
                     if file_index + 1 < len(entries)
                     else None
                 )
-                yield IngestionPage(records=list(batch), next_cursor=next_cursor)
-                batch.clear()
+                yield IngestionPage.model_construct(records=batch, next_cursor=next_cursor)
+                batch = []
 
         if not entries:
             yield IngestionPage(records=[], next_cursor=None)
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import fnmatch
+import os
+from collections.abc import Callable, Mapping, MutableMapping
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
+from multiprocessing import get_context
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Literal, Sequence
 
 import inspect
 
+import httpx
 import yaml
 from pydantic import BaseModel, Field, ValidationError, model_validator
 
@@ -22,8 +28,11 @@ from .common import (
     CheckpointManager,
     IngestionCheckpoint,
     IngestionPage,
+    MoleculeRecord,
     NDJSONWriter,
+    OutputCodec,
     SourceConfig,
+    build_http_client,
 )
 from ..logging_utils import get_logger
 from .pubchem import PubChemConfig, PubChemConnector
@@ -34,7 +43,7 @@ logger = get_logger(__name__)
 ClientFactory = Callable[..., object]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConnectorRegistration:
     """Associates a connector implementation with its config model."""
 
@@ -50,7 +59,7 @@ CONNECTOR_REGISTRY: dict[str, ConnectorRegistration] = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DirectorySummary:
     """Aggregated statistics for files contained in a directory."""
 
@@ -59,7 +68,7 @@ class DirectorySummary:
     total_bytes: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SourceIngestionSummary:
     """Execution summary for a single ingestion source."""
 
@@ -95,7 +104,16 @@ class IngestionJobConfig(BaseModel):
     checkpoint_dir: Path
     batch_size: int = Field(default=1000, gt=0)
     concurrency: int = Field(default=1, gt=0)
+    checkpoint_every: int = Field(default=8, gt=0)
+    min_batch_records: int = Field(default=1, gt=0)
     compress_output: bool = True
+    # Level 1 keeps compression cheap for intermediate batches; raise it to
+    # trade CPU time for smaller files (zstd accepts levels up to 22).
+    compress_level: int = Field(default=1, ge=1, le=22)
+    output_codec: OutputCodec = "gzip"
+    # Parsing holds the GIL, so concurrent sources run in separate processes
+    # unless client factories (which cannot be pickled) are supplied.
+    source_executor: Literal["thread", "process"] = "process"
     sources: list[SourceDefinition]
 
     @model_validator(mode="after")
@@ -105,6 +123,12 @@ class IngestionJobConfig(BaseModel):
             raise ValueError("Source names must be unique")
         return self
 
+    @model_validator(mode="after")
+    def ensure_valid_compress_level(self) -> IngestionJobConfig:
+        if self.output_codec == "gzip" and self.compress_level > 9:
+            raise ValueError("gzip output supports compress_level 1-9")
+        return self
+
 
 class IngestionJob(BaseModel):
     """Wrapper for loading YAML files containing job definitions."""
@@ -112,10 +136,16 @@ class IngestionJob(BaseModel):
     job: IngestionJobConfig
 
 
+# libyaml's C loader when PyYAML was built against it, else the pure-Python one.
+_YAML_LOADER: type[yaml.CSafeLoader] | type[yaml.SafeLoader] = getattr(
+    yaml, "CSafeLoader", yaml.SafeLoader
+)
+
+
 def load_config(path: Path) -> IngestionJobConfig:
     """Load an :class:`IngestionJobConfig` from a YAML file."""
 
-    data = yaml.safe_load(path.read_text(encoding="utf-8", errors="replace"))
+    data = yaml.load(path.read_text(encoding="utf-8", errors="replace"), Loader=_YAML_LOADER)
     try:
         wrapper = IngestionJob.model_validate(data)
     except ValidationError as exc:  # pragma: no cover - pydantic already tested
@@ -123,11 +153,25 @@ def load_config(path: Path) -> IngestionJobConfig:
     return wrapper.job
 
 
+_CONNECTOR_PARAMETERS: dict[type[BaseConnector], frozenset[str]] = {}
+
+
+def _connector_parameters(connector_cls: type[BaseConnector]) -> frozenset[str]:
+    """Return the keyword names accepted by *connector_cls*, introspected once."""
+
+    parameters = _CONNECTOR_PARAMETERS.get(connector_cls)
+    if parameters is None:
+        parameters = frozenset(inspect.signature(connector_cls.__init__).parameters)
+        _CONNECTOR_PARAMETERS[connector_cls] = parameters
+    return parameters
+
+
 def _build_connector(
     definition: SourceDefinition,
     checkpoint_manager: CheckpointManager,
     default_batch_size: int,
     client_factory: ClientFactory | None = None,
+    http_client: httpx.Client | None = None,
 ) -> BaseConnector:
     registration = CONNECTOR_REGISTRY[definition.type]
     config_kwargs = dict(definition.options)
@@ -138,43 +182,68 @@ def _build_connector(
         "config": config,
         "checkpoint_manager": checkpoint_manager,
     }
+    parameters = _connector_parameters(connector_cls)
     if client_factory is not None:
-        signature = inspect.signature(connector_cls.__init__)
-        if "client_factory" in signature.parameters:
+        if "client_factory" in parameters:
             kwargs["client_factory"] = client_factory
-        elif "ftp_factory" in signature.parameters:
+        elif "ftp_factory" in parameters:
             kwargs["ftp_factory"] = client_factory
+    elif http_client is not None and "http_client" in parameters:
+        kwargs["http_client"] = http_client
     return connector_cls(**kwargs)  # type: ignore[arg-type]
 
 
-def _persist_page(
-    writer: NDJSONWriter,
-    checkpoint_manager: CheckpointManager,
-    source_name: str,
-    start_batch: int,
-    page: IngestionPage,
-) -> None:
-    if not page.records:
-        checkpoint_manager.store(
-            source_name,
-            IngestionCheckpoint(
-                cursor=page.next_cursor or {},
-                batch_index=start_batch,
-                completed=page.next_cursor is None,
-            ),
+class _BatchAccumulator:
+    """Merge connector pages into NDJSON batches of at least ``min_records`` records."""
+
+    def __init__(
+        self, writer: NDJSONWriter, source_name: str, batch_index: int, min_records: int
+    ) -> None:
+        self._writer = writer
+        self._source_name = source_name
+        self._min_records = min_records
+        self._records: list[MoleculeRecord] = []
+        self._cursor: MutableMapping[str, Any] | None = None
+        self._pending = False
+        self.batch_index = batch_index
+        self.batches_written = 0
+        self.records_written = 0
+
+    @property
+    def pending(self) -> bool:
+        """Return whether pages have been added since the last flush."""
+
+        return self._pending
+
+    def add(self, page: IngestionPage) -> IngestionCheckpoint | None:
+        """Buffer *page*, returning a checkpoint if this triggered a flush."""
+
+        self._records.extend(page.records)
+        self._cursor = page.next_cursor
+        self._pending = True
+        if (
+            page.next_cursor is None
+            or not self._records
+            or len(self._records) >= self._min_records
+        ):
+            return self.flush()
+        return None
+
+    def flush(self) -> IngestionCheckpoint:
+        """Write buffered records and return the checkpoint after the last page."""
+
+        if self._records:
+            self.batch_index += 1
+            self._writer.write_batch(self._source_name, self.batch_index, self._records)
+            self.batches_written += 1
+            self.records_written += len(self._records)
+            self._records = []
+        self._pending = False
+        return IngestionCheckpoint(
+            cursor=self._cursor or {},
+            batch_index=self.batch_index,
+            completed=self._cursor is None,
         )
-        return
-
-    batch_index = start_batch + 1
-    writer.write_batch(source_name, batch_index, page.records)
-    checkpoint_manager.store(
-        source_name,
-        IngestionCheckpoint(
-            cursor=page.next_cursor or {},
-            batch_index=batch_index,
-            completed=page.next_cursor is None,
-        ),
-    )
 
 
 def _run_source(
@@ -183,20 +252,34 @@ def _run_source(
     client_factory: ClientFactory | None,
     checkpoint_root: Path,
     mode: str,
+    http_client: httpx.Client | None = None,
 ) -> SourceIngestionSummary:
     checkpoint_manager = CheckpointManager(checkpoint_root)
-    writer = NDJSONWriter(job_config.output_dir, compress=job_config.compress_output)
+    writer = NDJSONWriter(
+        job_config.output_dir,
+        compress=job_config.compress_output,
+        compresslevel=job_config.compress_level,
+        codec=job_config.output_codec,
+    )
     connector = _build_connector(
         definition,
         checkpoint_manager,
         default_batch_size=job_config.batch_size,
         client_factory=client_factory,
+        http_client=http_client,
     )
     checkpoint = checkpoint_manager.load(definition.name)
-    start_batch = checkpoint.batch_index if checkpoint else 0
-    batches_written = 0
-    records_written = 0
+    accumulator = _BatchAccumulator(
+        writer,
+        definition.name,
+        checkpoint.batch_index if checkpoint else 0,
+        job_config.min_batch_records,
+    )
     download_method = getattr(connector, "download_archives", None)
+    # Checkpoints are flushed every ``checkpoint_every`` batches; replaying the
+    # pages written since the last flush is idempotent.
+    pending_checkpoint: IngestionCheckpoint | None = None
+    batches_since_checkpoint = 0
 
     try:
         if mode == "download" and callable(download_method):
@@ -221,12 +304,21 @@ def _run_source(
                     reason="connector does not expose download_archives",
                 )
             for page in connector.fetch_pages():
-                _persist_page(writer, checkpoint_manager, definition.name, start_batch, page)
-                if page.records:
-                    start_batch += 1
-                    batches_written += 1
-                    records_written += len(page.records)
+                flushed = accumulator.add(page)
+                if flushed is None:
+                    continue
+                pending_checkpoint = flushed
+                batches_since_checkpoint += 1
+                if flushed.completed or batches_since_checkpoint >= job_config.checkpoint_every:
+                    checkpoint_manager.store(definition.name, flushed)
+                    pending_checkpoint = None
+                    batches_since_checkpoint = 0
+            if accumulator.pending:
+                pending_checkpoint = accumulator.flush()
     finally:
+        # Records still buffered in the accumulator are re-read on resume.
+        if pending_checkpoint is not None:
+            checkpoint_manager.store(definition.name, pending_checkpoint)
         connector.close()
 
     final_checkpoint = checkpoint_manager.load(definition.name)
@@ -234,7 +326,7 @@ def _run_source(
         total_batches = final_checkpoint.batch_index
         completed = bool(final_checkpoint.completed)
     else:
-        total_batches = start_batch
+        total_batches = accumulator.batch_index
         completed = mode == "download"
 
     output_summary = _summarise_output_directory(job_config.output_dir / definition.name)
@@ -245,8 +337,8 @@ def _run_source(
         type=definition.type,
         completed=completed,
         total_batches=total_batches,
-        batches_written=batches_written,
-        records_written=records_written,
+        batches_written=accumulator.batches_written,
+        records_written=accumulator.records_written,
         output=output_summary,
         downloads=download_summary,
     )
@@ -261,32 +353,46 @@ def _normalise_path(path: Path) -> Path:
         return path
 
 
-def _iter_files(directory: Path, patterns: Sequence[str] | None) -> list[Path]:
-    """Return the list of files matching *patterns* within *directory*."""
-
-    if not directory.exists():
-        return []
-    if not patterns:
-        return [path for path in directory.rglob("*") if path.is_file()]
-    matches: list[Path] = []
-    for pattern in patterns:
-        matches.extend(path for path in directory.glob(pattern) if path.is_file())
-    return matches
+def _scan_files(directory: Path, patterns: Sequence[str] | None) -> tuple[int, int]:
+    """Return ``(file_count, total_bytes)`` for files in *directory*.
+
+    Without *patterns* the directory is walked recursively; otherwise only its
+    direct children whose names match one of *patterns* are counted. Sizes come
+    from :func:`os.scandir` entries, avoiding a separate ``stat`` per path.
+    """
+
+    file_count = 0
+    total_bytes = 0
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if patterns is None and entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif entry.is_file() and (
+                        patterns is None
+                        or any(fnmatch.fnmatchcase(entry.name, pattern) for pattern in patterns)
+                    ):
+                        file_count += 1
+                        total_bytes += entry.stat().st_size
+        except FileNotFoundError:
+            continue
+    return file_count, total_bytes
 
 
 def _summarise_directory(path: Path, patterns: Sequence[str] | None) -> DirectorySummary:
     """Compute file statistics for *path* based on optional *patterns*."""
 
     directory = _normalise_path(path)
-    files = _iter_files(directory, patterns)
-    total_bytes = sum(file.stat().st_size for file in files)
-    return DirectorySummary(directory=directory, file_count=len(files), total_bytes=total_bytes)
+    file_count, total_bytes = _scan_files(directory, patterns)
+    return DirectorySummary(directory=directory, file_count=file_count, total_bytes=total_bytes)
 
 
 def _summarise_output_directory(path: Path) -> DirectorySummary:
     """Summarise the generated NDJSON batches for a source."""
 
-    return _summarise_directory(path, patterns=("*.jsonl", "*.jsonl.gz"))
+    return _summarise_directory(path, patterns=("*.jsonl", "*.jsonl.gz", "*.jsonl.zst"))
 
 
 def _summarise_downloads(connector: BaseConnector) -> DirectorySummary | None:
@@ -298,20 +404,75 @@ def _summarise_downloads(connector: BaseConnector) -> DirectorySummary | None:
     return _summarise_directory(Path(download_dir), patterns=None)
 
 
+# Largest unit first; sizes below 1 KB are rendered as whole bytes.
+_BYTE_UNITS = ((1 << 50, "PB"), (1 << 40, "TB"), (1 << 30, "GB"), (1 << 20, "MB"), (1 << 10, "KB"))
+
+
 def _format_bytes(size: int) -> str:
     """Render *size* in bytes using a human-readable unit."""
 
     if size <= 0:
         return "0 B"
-    units = ["B", "KB", "MB", "GB", "TB", "PB"]
-    value = float(size)
-    for unit in units:
-        if value < 1024 or unit == units[-1]:
-            if unit == "B":
-                return f"{int(value)} {unit}"
-            return f"{value:.2f} {unit}"
-        value /= 1024
-    return f"{int(value)} B"  # pragma: no cover - fallback
+    for threshold, unit in _BYTE_UNITS:
+        if size >= threshold:
+            return f"{size / threshold:.2f} {unit}"
+    return f"{size} B"
+
+
+_REPORT_HEADER = (
+    "| Source | Type | Completed | Total Batches | Batches (run) | Records (run) | "
+    "Output Files | Output Size | Download Files | Download Size |\n"
+    "| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |"
+)
+_REPORT_ROW = (
+    "| {name} | {type} | {completed} | {total_batches:,} | {batches_written:,} | "
+    "{records_written:,} | {output_files:,} | {output_size} | {download_files} | "
+    "{download_size} |"
+)
+_REPORT_DETAIL = "\n".join(
+    [
+        "",
+        "## {name}",
+        "",
+        "- **Source type**: {type}",
+        "- **Completed**: {completed}",
+        "- **Total batches**: {total_batches:,}",
+        "- **Batches written this run**: {batches_written:,}",
+        "- **Records written this run**: {records_written:,}",
+        "- **Output directory**: `{output_dir}`",
+        "- **Output artifacts**: {output_files:,} files totaling {output_size}",
+        "- **Download cache**: {download_cache}",
+    ]
+)
+
+
+def _report_fields(summary: SourceIngestionSummary) -> dict[str, object]:
+    """Return the values substituted into the report templates for *summary*."""
+
+    fields: dict[str, object] = {
+        "name": summary.name,
+        "type": summary.type,
+        "completed": "yes" if summary.completed else "no",
+        "total_batches": summary.total_batches,
+        "batches_written": summary.batches_written,
+        "records_written": summary.records_written,
+        "output_dir": summary.output.directory.as_posix(),
+        "output_files": summary.output.file_count,
+        "output_size": _format_bytes(summary.output.total_bytes),
+        "download_files": "n/a",
+        "download_size": "n/a",
+        "download_cache": "n/a",
+    }
+    downloads = summary.downloads
+    if downloads is not None:
+        download_size = _format_bytes(downloads.total_bytes)
+        fields["download_files"] = f"{downloads.file_count:,}"
+        fields["download_size"] = download_size
+        fields["download_cache"] = (
+            f"`{downloads.directory.as_posix()}` "
+            f"({downloads.file_count:,} files, {download_size})"
+        )
+    return fields
 
 
 def _write_raw_data_report(
@@ -332,55 +493,13 @@ def _write_raw_data_report(
         "",
     ]
 
-    if summaries:
-        lines.append(
-            "| Source | Type | Completed | Total Batches | Batches (run) | Records (run) | "
-            "Output Files | Output Size | Download Files | Download Size |"
-        )
-        lines.append("| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |")
-        for summary in summaries:
-            download_files = (
-                f"{summary.downloads.file_count:,}"
-                if summary.downloads is not None
-                else "n/a"
-            )
-            download_size = (
-                _format_bytes(summary.downloads.total_bytes)
-                if summary.downloads is not None
-                else "n/a"
-            )
-            lines.append(
-                "| "
-                f"{summary.name} | {summary.type} | {'yes' if summary.completed else 'no'} | "
-                f"{summary.total_batches:,} | {summary.batches_written:,} | {summary.records_written:,} | "
-                f"{summary.output.file_count:,} | {_format_bytes(summary.output.total_bytes)} | "
-                f"{download_files} | {download_size} |"
-            )
+    fields = [_report_fields(summary) for summary in summaries]
+    if fields:
+        lines.append(_REPORT_HEADER)
+        lines.extend(_REPORT_ROW.format_map(row) for row in fields)
     else:
         lines.append("No sources were executed.")
-
-    for summary in summaries:
-        lines.extend([
-            "",
-            f"## {summary.name}",
-            "",
-            f"- **Source type**: {summary.type}",
-            f"- **Completed**: {'yes' if summary.completed else 'no'}",
-            f"- **Total batches**: {summary.total_batches:,}",
-            f"- **Batches written this run**: {summary.batches_written:,}",
-            f"- **Records written this run**: {summary.records_written:,}",
-            f"- **Output directory**: `{summary.output.directory.as_posix()}`",
-            f"- **Output artifacts**: {summary.output.file_count:,} files totaling {_format_bytes(summary.output.total_bytes)}",
-        ])
-
-        if summary.downloads is not None:
-            lines.append(
-                f"- **Download cache**: `{summary.downloads.directory.as_posix()}` "
-                f"({summary.downloads.file_count:,} files, "
-                f"{_format_bytes(summary.downloads.total_bytes)})"
-            )
-        else:
-            lines.append("- **Download cache**: n/a")
+    lines.extend(_REPORT_DETAIL.format_map(row) for row in fields)
 
     report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
@@ -396,38 +515,71 @@ def run_ingestion(
     config.output_dir.mkdir(parents=True, exist_ok=True)
     config.checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
+    factories: Mapping[str, ClientFactory] = client_factories or {}
+
     def _factory_for(definition: SourceDefinition) -> ClientFactory | None:
-        if not client_factories:
-            return None
-        return client_factories.get(definition.name) or client_factories.get(definition.type)
+        return factories.get(definition.name) or factories.get(definition.type)
 
     summaries: list[SourceIngestionSummary] = []
     checkpoint_root = config.checkpoint_dir / (
         "ingestion-download" if mode == "download" else "ingestion-parse"
     )
 
-    with ThreadPoolExecutor(max_workers=config.concurrency) as executor:
-        futures = {
-            executor.submit(
-                _run_source,
-                source,
-                config,
-                _factory_for(source),
-                checkpoint_root,
-                mode,
-            ): source.name
-            for source in config.sources
-        }
+    # Threads beyond the number of sources would only sit idle.
+    workers = min(config.concurrency, len(config.sources))
+    # Downloads wait on aria2c subprocesses, so threads suffice there.
+    use_processes = (
+        workers > 1
+        and mode != "download"
+        and config.source_executor == "process"
+        and not factories
+    )
+
+    # HTTP sources share one connection pool instead of handshaking per source.
+    shared_client: httpx.Client | None = None
+    if not use_processes and any(
+        issubclass(CONNECTOR_REGISTRY[source.type].connector, BaseHttpConnector)
+        for source in config.sources
+    ):
+        shared_client = build_http_client()
+
+    def _execute(source: SourceDefinition) -> SourceIngestionSummary:
+        return _run_source(
+            source, config, _factory_for(source), checkpoint_root, mode, shared_client
+        )
+
+    def _record(source_name: str, outcome: Callable[[], SourceIngestionSummary]) -> None:
+        try:
+            summary = outcome()
+        except Exception as exc:  # pragma: no cover - surfaced in tests
+            logger.error("ingestion.failed", source=source_name, error=str(exc))
+            raise
+        logger.info("ingestion.completed", source=source_name)
+        summaries.append(summary)
+
+    futures: dict[Future[SourceIngestionSummary], str] = {}
+    with ExitStack() as stack:
+        if shared_client is not None:
+            stack.callback(shared_client.close)
+        if workers <= 1:
+            # Sequential jobs run on the calling thread without pool overhead.
+            for source in config.sources:
+                _record(source.name, partial(_execute, source))
+        elif use_processes:
+            # Each source parses under its own interpreter lock; connectors
+            # build their own HTTP clients in the worker.
+            pool = stack.enter_context(
+                ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+            )
+            futures = {
+                pool.submit(_run_source, source, config, None, checkpoint_root, mode): source.name
+                for source in config.sources
+            }
+        else:
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+            futures = {executor.submit(_execute, source): source.name for source in config.sources}
         for future in as_completed(futures):
-            source_name = futures[future]
-            try:
-                summary = future.result()
-            except Exception as exc:  # pragma: no cover - surfaced in tests
-                logger.error("ingestion.failed", source=source_name, error=str(exc))
-                raise
-            else:
-                logger.info("ingestion.completed", source=source_name)
-                summaries.append(summary)
+            _record(futures[future], future.result)
 
     summaries.sort(key=lambda item: item.name)
     _write_raw_data_report(config, summaries)
@@ -2,63 +2,299 @@
 
 from __future__ import annotations
 
-import gzip
-from collections.abc import Iterable, Iterator
+import mmap
+import re
+import sys
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
 
+from .compression import open_gzip_reader
+from .parallel import iter_parsed_ahead
+
+# Compressed archives are inflated in large blocks so record splitting runs on
+# big buffers instead of one ``readline`` call per line.
+_READ_SIZE = 16 << 20
+_TERMINATOR = b"$$$$"
+# Data item header lines, capturing the name between the first ``<`` and the
+# next ``>``. Each item's value runs until the next header line.
+_HEADER_RE = re.compile(r"^>(?:[^<\n]*<([^>\n]*)>)?[^\n]*", re.MULTILINE)
+
+Buffer = bytes | mmap.mmap
+# identifier tag, SMILES tag, tags excluded from metadata, metadata allow-list
+FieldTags = tuple[str, str, frozenset[str], tuple[str, ...] | None]
+# identifier, SMILES, metadata
+RecordFields = tuple[str, str, dict[str, str]]
+
+
+def _find_terminator(buffer: Buffer, pos: int, eof: bool) -> tuple[int, int] | None:
+    """Locate the next ``$$$$`` line at or after *pos*.
+
+    Returns ``(line_start, next_pos)`` or ``None`` when no complete terminator
+    line is available yet. *pos* must point at the start of a line.
+    """
+
+    index = buffer.find(_TERMINATOR, pos)
+    while index != -1:
+        newline = buffer.rfind(b"\n", pos, index)
+        line_start = pos if newline == -1 else newline + 1
+        line_end = buffer.find(b"\n", index)
+        if line_end == -1:
+            if not eof:
+                return None
+            line_end = len(buffer)
+            next_pos = line_end
+        else:
+            next_pos = line_end + 1
+        if buffer[line_start:line_end].strip() == _TERMINATOR:
+            return line_start, next_pos
+        index = buffer.find(_TERMINATOR, index + len(_TERMINATOR))
+    return None
+
+
+def _split_records(buffer: Buffer, eof: bool) -> tuple[list[bytes], int]:
+    """Split *buffer* into raw record blocks, returning them and the bytes consumed."""
+
+    blocks: list[bytes] = []
+    pos = 0
+    while (found := _find_terminator(buffer, pos, eof)) is not None:
+        line_start, pos_after = found
+        blocks.append(buffer[pos:line_start])
+        pos = pos_after
+    if eof and pos < len(buffer):
+        blocks.append(buffer[pos:])
+        pos = len(buffer)
+    return blocks, pos
+
+
+def _iter_record_blocks(path: Path) -> Iterator[bytes]:
+    """Yield the raw bytes between ``$$$$`` terminators in *path*."""
 
-def _open_sdf(path: Path) -> Iterator[str]:
     if path.suffix == ".gz":
-        with gzip.open(path, "rt", encoding="utf-8", errors="replace") as stream:
-            for line in stream:
-                yield line.rstrip("\n")
+        with open_gzip_reader(path) as stream:
+            pending = b""
+            while True:
+                chunk = stream.read(_READ_SIZE)
+                eof = not chunk
+                buffer = pending + chunk if pending else chunk
+                blocks, consumed = _split_records(buffer, eof)
+                yield from blocks
+                pending = buffer[consumed:]
+                if eof:
+                    return
     else:
-        with path.open("r", encoding="utf-8", errors="replace") as stream:
-            for line in stream:
-                yield line.rstrip("\n")
+        with path.open("rb") as stream:
+            if path.stat().st_size == 0:
+                return
+            with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                # Copy one record at a time so only the current block is held.
+                pos = 0
+                while (found := _find_terminator(mapped, pos, eof=True)) is not None:
+                    line_start, next_pos = found
+                    yield mapped[pos:line_start]
+                    pos = next_pos
+                if pos < len(mapped):
+                    yield mapped[pos:]
 
 
-def _parse_entry(lines: Iterable[str]) -> dict[str, str]:
-    properties: dict[str, str] = {}
-    current_tag: str | None = None
-    buffer: list[str] = []
-
-    for line in lines:
-        if line.startswith(">"):
-            if current_tag is not None:
-                properties[current_tag] = "\n".join(buffer).strip()
-            start = line.find("<")
-            end = line.find(">", start + 1)
-            if start != -1 and end != -1:
-                current_tag = line[start + 1 : end].strip()
-                buffer = []
-            else:
-                current_tag = None
-                buffer = []
-        elif current_tag is not None:
-            buffer.append(line.rstrip("\r"))
-
-    if current_tag is not None:
-        properties[current_tag] = "\n".join(buffer).strip()
+def _decode(block: bytes) -> str:
+    text = block.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _parse_entry(text: str, tags: frozenset[str] | None = None) -> dict[str, str]:
+    """Map each ``> <TAG>`` header in *text* to the stripped text up to the next header.
+
+    When *tags* is given only those data items are kept; other values are never
+    stripped or stored.
+    """
+
+    # ``split`` yields [mol block, tag, value, tag, value, ...]; the tag is
+    # ``None`` for headers without a ``<TAG>`` and the following value is dropped.
+    parts = _HEADER_RE.split(text)
+    pairs = zip(parts[1::2], parts[2::2], strict=True)
+    # Tag names repeat across every record; share one string per name.
+    intern = sys.intern
+    if tags is None:
+        return {intern(tag.strip()): value.strip() for tag, value in pairs if tag is not None}
+    return {
+        intern(name): value.strip()
+        for tag, value in pairs
+        if tag is not None and (name := tag.strip()) in tags
+    }
+
+
+def _find_item(text: str, tag: str, needle: str) -> str | None:
+    """Return the value of the last data item whose header contains *needle*.
+
+    *needle* is ``"<TAG>"``. A match only counts when it is the first ``<`` on
+    a header line, as in :func:`_parse_entry`. Returns ``None`` when no header
+    matches or when *tag* appears again further on, where a padded ``< TAG >``
+    header could override the match.
+    """
+
+    index = len(text)
+    while (index := text.rfind(needle, 0, index)) != -1:
+        line_start = text.rfind("\n", 0, index) + 1
+        if text.startswith(">", line_start) and text.find("<", line_start, index) == -1:
+            if text.find(tag, index + len(needle)) != -1:
+                return None
+            value_start = text.find("\n", index)
+            if value_start == -1:
+                return ""
+            value_end = text.find("\n>", value_start)
+            return text[value_start : value_end if value_end != -1 else len(text)].strip()
+    return None
+
 
+def _select_items(
+    text: str, needles: tuple[tuple[str, str], ...], tags: frozenset[str]
+) -> dict[str, str]:
+    """Look up the few wanted data items directly instead of splitting the record.
+
+    Records where a wanted tag is missing or ambiguous fall back to
+    :func:`_parse_entry` so the result is the same.
+    """
+
+    properties: dict[str, str] = {}
+    for tag, needle in needles:
+        value = _find_item(text, tag, needle)
+        if value is None:
+            return _parse_entry(text, tags)
+        properties[tag] = value
     return properties
 
 
-def iter_sdf_records(path: Path) -> Iterator[dict[str, str]]:
-    """Yield property dictionaries for each SDF record in *path*."""
+def iter_sdf_records(
+    path: Path, skip: int = 0, tags: frozenset[str] | None = None
+) -> Iterator[dict[str, str]]:
+    """Yield property dictionaries for each SDF record in *path*.
 
-    lines: list[str] = []
-    for line in _open_sdf(path):
-        if line.strip() == "$$$$":
-            if lines:
-                yield _parse_entry(lines)
-                lines = []
+    Records are split on raw bytes (memory-mapped for uncompressed files) and
+    only decoded when they are yielded. The first *skip* records are stepped
+    over without being decoded or parsed, which keeps checkpoint resumes cheap.
+    Passing *tags* restricts each dictionary to those data items.
+    """
+
+    needles = tuple((tag, f"<{tag}>") for tag in tags or ())
+    for block in _iter_record_blocks(path):
+        if not block:
+            continue
+        if skip > 0:
+            skip -= 1
+            continue
+        if tags is None:
+            yield _parse_entry(_decode(block))
         else:
-            lines.append(line)
+            yield _select_items(_decode(block), needles, tags)
+
+
+def build_field_tags(
+    identifier_tag: str, smiles_tag: str, metadata_tags: Sequence[str]
+) -> FieldTags:
+    """Precompute the tag lookups used by :func:`extract_fields`.
+
+    An empty *metadata_tags* keeps every non-empty property other than the
+    identifier and SMILES tags.
+    """
+
+    skip_tags = frozenset((identifier_tag, smiles_tag))
+    allowed = (
+        tuple(tag for tag in metadata_tags if tag not in skip_tags) if metadata_tags else None
+    )
+    return identifier_tag, smiles_tag, skip_tags, allowed
+
+
+def _wanted_tags(field_tags: FieldTags) -> frozenset[str] | None:
+    """Return the data items :func:`extract_fields` reads, or ``None`` for all."""
+
+    identifier_tag, smiles_tag, _, metadata_tags = field_tags
+    if metadata_tags is None:
+        return None
+    return frozenset((identifier_tag, smiles_tag, *metadata_tags))
+
+
+def extract_fields(
+    properties: Mapping[str, str],
+    identifier_tag: str,
+    smiles_tag: str,
+    skip_tags: frozenset[str],
+    metadata_tags: tuple[str, ...] | None,
+) -> RecordFields:
+    """Return ``(identifier, smiles, metadata)`` for one parsed SDF record."""
+
+    if metadata_tags is not None:
+        metadata = {key: value for key in metadata_tags if (value := properties.get(key))}
+    else:
+        metadata = {
+            key: value for key, value in properties.items() if value and key not in skip_tags
+        }
+    # iter_sdf_records already strips property values.
+    return (
+        properties.get(identifier_tag, ""),
+        properties.get(smiles_tag, ""),
+        metadata,
+    )
+
+
+def _parse_archive(path: Path, skip: int, field_tags: FieldTags) -> list[RecordFields]:
+    """Parse *path* in a worker process, returning plain tuples for cheap pickling."""
+
+    return [
+        extract_fields(properties, *field_tags)
+        for properties in iter_sdf_records(path, skip, _wanted_tags(field_tags))
+    ]
+
+
+def iter_archive_fields(
+    resolve: Callable[[int], Path],
+    indices: range,
+    start_offset: int,
+    field_tags: FieldTags,
+    workers: int = 1,
+) -> Iterator[tuple[int, Iterable[RecordFields]]]:
+    """Yield ``(index, fields)`` for each archive index in *indices*, in order.
+
+    Parameters
+    ----------
+    resolve:
+        Maps an archive index to its local path. Errors it raises (for example
+        a missing archive) surface when that archive is reached.
+    indices:
+        Archive indices to parse.
+    start_offset:
+        Number of records skipped in the first archive.
+    field_tags:
+        Tag lookups from :func:`build_field_tags`.
+    workers:
+        Worker processes parsing upcoming archives ahead of the one being
+        consumed. With a single worker archives are streamed in-process.
+    """
 
-    if lines:
-        yield _parse_entry(lines)
+    start = indices.start
+    if workers <= 1 or len(indices) <= 1:
+        tags = _wanted_tags(field_tags)
+        for index in indices:
+            path = resolve(index)
+            skip = start_offset if index == start else 0
+            yield index, (
+                extract_fields(properties, *field_tags)
+                for properties in iter_sdf_records(path, skip, tags)
+            )
+        return
 
+    def prepare(index: int) -> tuple[Path, int, FieldTags]:
+        return resolve(index), start_offset if index == start else 0, field_tags
 
-__all__ = ["iter_sdf_records"]
+    for index, rows in iter_parsed_ahead(indices, prepare, _parse_archive, workers):
+        yield index, rows or ()
 
+__all__ = [
+    "FieldTags",
+    "RecordFields",
+    "build_field_tags",
+    "extract_fields",
+    "iter_archive_fields",
+    "iter_sdf_records",
+]
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
-import gzip
+import io
 import subprocess
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
-from pathlib import Path, PurePosixPath
+from functools import lru_cache
+from pathlib import Path
 from typing import Callable, Iterator
 from urllib.parse import urlparse
 
 from pydantic import Field
 
 from ..logging_utils import get_logger
-from .aria2 import Aria2Options, download_with_aria2
+from .aria2 import (
+    Aria2Options,
+    download_many_with_aria2,
+    download_with_aria2,
+    is_download_complete,
+)
 from .common import (
     BaseConnector,
     CheckpointManager,
@@ -20,9 +27,111 @@ from .common import (
     MoleculeRecord,
     SourceConfig,
 )
+from .compression import open_gzip_reader
+from .parallel import iter_parsed_ahead
 
 logger = get_logger(__name__)
 
+# Tranches are decoded in large text blocks and split in bulk rather than
+# iterated one ``readline`` at a time.
+_READ_SIZE = 128 * 1024
+
+
+def _iter_lines(stream: io.TextIOBase) -> Iterator[str]:
+    """Yield the lines of *stream*, without line endings, reading in bulk blocks."""
+
+    pending = ""
+    while chunk := stream.read(_READ_SIZE):
+        lines = (pending + chunk).split("\n")
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
+# identifier, SMILES, metadata
+_Row = tuple[str, str, dict[str, str]]
+# archive path, source name, source file, download URL, delimiter, SMILES and
+# identifier column indices, records to skip
+_RowArgs = tuple[Path, str, str, str, str | None, int, int, int]
+
+
+def _iter_rows(
+    archive_path: Path,
+    source: str,
+    source_file: str,
+    url: str,
+    delimiter: str | None,
+    smiles_index: int,
+    identifier_index: int,
+    skip: int = 0,
+) -> Iterator[_Row]:
+    """Yield ``(identifier, smiles, metadata)`` for each valid line of a tranche.
+
+    The first *skip* valid lines are counted but never stripped or turned into
+    rows, which keeps checkpoint resumes cheap.
+    """
+
+    stream_ctx: io.TextIOWrapper
+    if archive_path.suffix == ".gz":
+        stream_ctx = io.TextIOWrapper(
+            open_gzip_reader(archive_path), encoding="utf-8", errors="replace"
+        )
+    else:
+        stream_ctx = archive_path.open("r", encoding="utf-8", errors="replace")
+
+    min_width = max(smiles_index, identifier_index) + 1
+    base = {"source_file": source_file, "download_url": url}
+    # ``(index, key)`` pairs of the metadata columns, computed once per row width.
+    columns_by_width: dict[int, tuple[tuple[int, str], ...]] = {}
+    remaining_skip = skip
+    with stream_ctx as stream:
+        for line_number, raw_line in enumerate(_iter_lines(stream), start=1):
+            line = raw_line.strip()
+            if not line:
+                continue
+            parts = line.split(delimiter) if delimiter else line.split()
+            width = len(parts)
+            if width < min_width or not parts[smiles_index] or not parts[identifier_index]:
+                logger.debug(
+                    "ingestion.zinc.skip_line",
+                    source=source,
+                    file=source_file,
+                    line=line_number,
+                )
+                continue
+            if remaining_skip:
+                remaining_skip -= 1
+                continue
+
+            columns = columns_by_width.get(width)
+            if columns is None:
+                columns = tuple(
+                    (idx, f"column_{idx}")
+                    for idx in range(width)
+                    if idx != smiles_index and idx != identifier_index
+                )
+                columns_by_width[width] = columns
+            metadata = base.copy()
+            for idx, key in columns:
+                metadata[key] = parts[idx].strip()
+            yield parts[identifier_index].strip(), parts[smiles_index].strip(), metadata
+
+    if remaining_skip:
+        logger.warning(
+            "ingestion.zinc.offset_exceeds_file",
+            source=source,
+            file=source_file,
+            expected_offset=skip,
+            available_records=skip - remaining_skip,
+        )
+
+
+def _read_rows(args: _RowArgs) -> list[_Row]:
+    """Parse a whole tranche in a worker process; see :func:`_iter_rows`."""
+
+    return list(_iter_rows(*args))
+
 
 @dataclass(frozen=True)
 class _TrancheResource:
@@ -32,6 +141,48 @@ class _TrancheResource:
     relative_path: Path
 
 
+def _url_path(url: str) -> str:
+    """Return the path component of *url*, as :func:`urllib.parse.urlparse` would."""
+
+    scheme_end = url.find("://")
+    # Plain ``scheme://host/path`` URLs are sliced directly; anything with a
+    # query, fragment, params or no scheme goes through urlparse.
+    if scheme_end == -1 or "?" in url or "#" in url or ";" in url:
+        return urlparse(url).path
+    path_start = url.find("/", scheme_end + 3)
+    return url[path_start:] if path_start != -1 else ""
+
+
+@lru_cache(maxsize=32)
+def _load_uri_file(path: Path, mtime_ns: int, size: int) -> tuple[_TrancheResource, ...]:
+    """Parse the tranche manifest at *path*, memoised on its modification time and size."""
+
+    resources: list[_TrancheResource] = []
+    # ZINC manifests list millions of tranches; read them line by line.
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        for line_number, raw_line in enumerate(handle, start=1):
+            line = raw_line.strip()
+            if not line or line.startswith("#"):
+                continue
+            url = line.split()[0]
+            url_path = _url_path(url)
+            if not url_path:
+                raise ValueError(
+                    f"Unable to determine output path for URL on line {line_number}: {line}"
+                )
+            # Same segments as PurePosixPath(...).parts: empty and "." entries drop out.
+            parts = [part for part in url_path.split("/") if part and part != "."]
+            if not parts:
+                raise ValueError(
+                    f"Invalid URL with empty path on line {line_number}: {line}"
+                )
+            resources.append(_TrancheResource(url=url, relative_path=Path(*parts)))
+
+    if not resources:
+        raise ValueError(f"No tranche URLs found in manifest: {path}")
+    return tuple(resources)
+
+
 class ZincConfig(SourceConfig):
     """Configuration for ingesting ZINC tranche downloads."""
 
@@ -75,6 +226,19 @@ class ZincConfig(SourceConfig):
         ge=0,
         description="Index of the identifier column in tranche files.",
     )
+    max_concurrent_downloads: int = Field(
+        default=16,
+        gt=0,
+        description="Number of tranches aria2 downloads in parallel.",
+    )
+    parse_workers: int = Field(
+        default=1,
+        gt=0,
+        description=(
+            "Worker processes parsing upcoming tranches ahead of the current one. "
+            "Each in-flight tranche is held in memory while it waits."
+        ),
+    )
 
 
 class ZincConnector(BaseConnector):
@@ -87,11 +251,16 @@ class ZincConnector(BaseConnector):
         config: ZincConfig,
         checkpoint_manager: CheckpointManager,
         aria2_downloader: Callable[..., None] | None = None,
+        aria2_batch_downloader: Callable[..., None] | None = None,
     ) -> None:
         super().__init__(config=config, checkpoint_manager=checkpoint_manager)
         self._download_dir = self._resolve_download_dir()
         self._resources = self._parse_uri_file(config.uri_file)
         self._aria2_downloader = aria2_downloader or download_with_aria2
+        # A custom single-file downloader keeps the per-tranche download path.
+        self._aria2_batch_downloader = aria2_batch_downloader or (
+            None if aria2_downloader else download_many_with_aria2
+        )
         self._aria2_options = self._build_aria2_options()
 
     def _build_aria2_options(self) -> Aria2Options:
@@ -110,35 +279,13 @@ class ZincConnector(BaseConnector):
     def _parse_uri_file(self, path: Path) -> list[_TrancheResource]:
         if not path.exists():
             raise FileNotFoundError(f"URI manifest not found: {path}")
-
-        resources: list[_TrancheResource] = []
-        for line_number, raw_line in enumerate(
-            path.read_text(encoding="utf-8", errors="replace").splitlines(), start=1
-        ):
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            url = line.split()[0]
-            parsed = urlparse(url)
-            if not parsed.path:
-                raise ValueError(
-                    f"Unable to determine output path for URL on line {line_number}: {line}"
-                )
-            relative = PurePosixPath(parsed.path.lstrip("/"))
-            if not relative.parts:
-                raise ValueError(
-                    f"Invalid URL with empty path on line {line_number}: {line}"
-                )
-            resources.append(_TrancheResource(url=url, relative_path=Path(*relative.parts)))
-
-        if not resources:
-            raise ValueError(f"No tranche URLs found in manifest: {path}")
-        return resources
+        stat = path.stat()
+        return list(_load_uri_file(path.resolve(), stat.st_mtime_ns, stat.st_size))
 
     def _ensure_archive(self, resource: _TrancheResource) -> Path | None:
         target_path = self._download_dir / resource.relative_path
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        if target_path.exists() and target_path.stat().st_size > 0:
+        if is_download_complete(target_path):
             return target_path
 
         if not self.config.download_missing:
@@ -146,32 +293,92 @@ class ZincConnector(BaseConnector):
                 f"Required tranche archive is missing: {target_path}. "
                 "Set download_missing=True to fetch automatically."
             )
+        return self._download_tranche(resource, target_path)
 
+    def _download_tranche(self, resource: _TrancheResource, target_path: Path) -> Path | None:
         logger.info(
             "ingestion.zinc.download",
             source=self.config.name,
             url=resource.url,
             output=str(target_path),
         )
+        try:
+            self._aria2_downloader(resource.url, target_path, **self._download_kwargs())
+        except subprocess.CalledProcessError as exc:
+            logger.error(
+                "ingestion.zinc.download_failed",
+                source=self.config.name,
+                url=resource.url,
+                output=str(target_path),
+                returncode=exc.returncode,
+            )
+            return None
+        return target_path
+
+    def _download_kwargs(self) -> dict[str, object]:
         kwargs: dict[str, object] = {"options": self._aria2_options, "skip_existing": False}
         if self.config.username:
             kwargs["username"] = self.config.username
         if self.config.password:
             kwargs["password"] = self.config.password
+        return kwargs
+
+    def _download_batched(
+        self, downloader: Callable[..., None], resources: Sequence[_TrancheResource]
+    ) -> None:
+        """Fetch every incomplete tranche in *resources* with one downloader call."""
+
+        pending = [
+            (resource.url, target)
+            for resource in resources
+            if not is_download_complete(target := self._download_dir / resource.relative_path)
+        ]
+        if not pending:
+            return
+        logger.info("ingestion.zinc.download", source=self.config.name, files=len(pending))
         try:
-            self._aria2_downloader(resource.url, target_path, **kwargs)
+            downloader(
+                pending,
+                max_concurrent_downloads=self.config.max_concurrent_downloads,
+                **self._download_kwargs(),
+            )
         except subprocess.CalledProcessError as exc:
             logger.error(
                 "ingestion.zinc.download_failed",
                 source=self.config.name,
-                url=resource.url,
-                output=str(target_path),
+                files=len(pending),
                 returncode=exc.returncode,
             )
-            return None
-        return target_path
 
-    def _iter_records(self, resource: _TrancheResource) -> Iterator[MoleculeRecord]:
+    def download_archives(self) -> list[Path]:
+        """Ensure all referenced tranche archives are present locally."""
+
+        batch_downloader = self._aria2_batch_downloader
+        if batch_downloader is not None:
+            self._download_batched(batch_downloader, self._resources)
+
+        downloaded: list[Path] = []
+        for resource in self._resources:
+            target_path = self._download_dir / resource.relative_path
+            if is_download_complete(target_path):
+                downloaded.append(target_path)
+                continue
+            archive = None
+            if batch_downloader is None:
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                archive = self._download_tranche(resource, target_path)
+            if archive is None:
+                logger.warning(
+                    "ingestion.zinc.skip_entry",
+                    source=self.config.name,
+                    file=resource.relative_path.as_posix(),
+                    url=resource.url,
+                )
+                continue
+            downloaded.append(archive)
+        return downloaded
+
+    def _resolve_archive(self, resource: _TrancheResource) -> Path | None:
         archive_path = self._ensure_archive(resource)
         if archive_path is None:
             logger.warning(
@@ -180,53 +387,57 @@ class ZincConnector(BaseConnector):
                 file=resource.relative_path.as_posix(),
                 url=resource.url,
             )
-            return
-        delimiter = self.config.delimiter
-        smiles_index = self.config.smiles_column
-        identifier_index = self.config.identifier_column
-
-        if archive_path.suffix == ".gz":
-            stream_ctx = gzip.open(archive_path, "rt", encoding="utf-8", errors="replace")
-        else:
-            stream_ctx = archive_path.open("r", encoding="utf-8", errors="replace")
-
-        with stream_ctx as stream:
-            for line_number, raw_line in enumerate(stream, start=1):
-                line = raw_line.strip()
-                if not line:
-                    continue
-                parts = line.split(delimiter) if delimiter else line.split()
-                if (
-                    len(parts) <= max(smiles_index, identifier_index)
-                    or not parts[smiles_index]
-                    or not parts[identifier_index]
-                ):
-                    logger.debug(
-                        "ingestion.zinc.skip_line",
-                        source=self.config.name,
-                        file=str(resource.relative_path),
-                        line=line_number,
+        return archive_path
+
+    def _row_args(self, resource: _TrancheResource, archive_path: Path, skip: int) -> _RowArgs:
+        return (
+            archive_path,
+            self.config.name,
+            resource.relative_path.as_posix(),
+            resource.url,
+            self.config.delimiter,
+            self.config.smiles_column,
+            self.config.identifier_column,
+            skip,
+        )
+
+    def _iter_tranches(
+        self, start_entry: int, start_offset: int
+    ) -> Iterator[tuple[int, Iterable[_Row]]]:
+        """Yield ``(resource_index, rows)`` for each tranche from *start_entry* onwards.
+
+        The first *start_offset* records of the first tranche are skipped.
+
+        With ``parse_workers`` above one, upcoming tranches are fetched (when
+        ``download_missing`` is set) as they are queued and parsed in worker
+        processes while the current one is consumed. A tranche that cannot be
+        resolved still raises only once it is reached, after earlier ones.
+        """
+
+        resources = self._resources
+        indices = range(start_entry, len(resources))
+        workers = self.config.parse_workers
+        if workers <= 1 or len(indices) <= 1:
+            for index in indices:
+                archive_path = self._resolve_archive(resources[index])
+                if archive_path is None:
+                    yield index, ()
+                else:
+                    skip = start_offset if index == start_entry else 0
+                    yield index, _iter_rows(
+                        *self._row_args(resources[index], archive_path, skip)
                     )
-                    continue
-
-                smiles = parts[smiles_index].strip()
-                identifier = parts[identifier_index].strip()
-                metadata = {
-                    "source_file": resource.relative_path.as_posix(),
-                    "download_url": resource.url,
-                }
-                for idx, value in enumerate(parts):
-                    if idx in {smiles_index, identifier_index}:
-                        continue
-                    key = f"column_{idx}"
-                    metadata[key] = value.strip()
-
-                yield MoleculeRecord(
-                    source=self.config.name,
-                    identifier=identifier,
-                    smiles=smiles,
-                    metadata=metadata,
-                )
+            return
+
+        def prepare(index: int) -> tuple[_RowArgs] | None:
+            archive_path = self._resolve_archive(resources[index])
+            if archive_path is None:
+                return None
+            skip = start_offset if index == start_entry else 0
+            return (self._row_args(resources[index], archive_path, skip),)
+
+        for index, rows in iter_parsed_ahead(indices, prepare, _read_rows, workers):
+            yield index, rows or ()
 
     @property
     def download_directory(self) -> Path:
@@ -246,19 +457,28 @@ class ZincConnector(BaseConnector):
             start_entry = int(checkpoint.cursor.get("entry_index", 0))
             start_offset = int(checkpoint.cursor.get("line_offset", 0))
 
-        batch: list[MoleculeRecord] = []
         resources = self._resources
-        for resource_index in range(start_entry, len(resources)):
-            resource = resources[resource_index]
-            line_offset = start_offset if resource_index == start_entry else 0
-            processed_lines = 0
+        if self.config.download_missing and self._aria2_batch_downloader is not None:
+            # Fetch every missing tranche up front in one aria2c process; any that
+            # still fail are retried one at a time as they are reached.
+            self._download_batched(self._aria2_batch_downloader, resources[start_entry:])
 
-            for record in self._iter_records(resource):
-                if processed_lines < line_offset:
-                    processed_lines += 1
-                    continue
-
-                batch.append(record)
+        batch: list[MoleculeRecord] = []
+        source = self.config.name
+        construct = MoleculeRecord.model_construct
+        for resource_index, rows in self._iter_tranches(start_entry, start_offset):
+            resource = resources[resource_index]
+            # Records before the checkpoint offset are skipped while parsing.
+            first_line = start_offset if resource_index == start_entry else 0
+            processed_lines = first_line
+
+            for identifier, smiles, metadata in rows:
+                # Columns are already stripped strings; skip pydantic validation.
+                batch.append(
+                    construct(
+                        source=source, identifier=identifier, smiles=smiles, metadata=metadata
+                    )
+                )
                 processed_lines += 1
                 if len(batch) >= self.config.batch_size:
                     next_cursor = {
@@ -266,20 +486,8 @@ class ZincConnector(BaseConnector):
                         "line_offset": processed_lines,
                         "file": resource.relative_path.as_posix(),
                     }
-                    yield IngestionPage(records=list(batch), next_cursor=next_cursor)
-                    batch.clear()
-
-            if line_offset and processed_lines < line_offset:
-                logger.warning(
-                    "ingestion.zinc.offset_exceeds_file",
-                    source=self.config.name,
-                    file=resource.relative_path.as_posix(),
-                    expected_offset=line_offset,
-                    available_records=processed_lines,
-                )
-                line_offset = processed_lines
-
-            start_offset = 0
+                    yield IngestionPage.model_construct(records=batch, next_cursor=next_cursor)
+                    batch = []
 
             next_cursor: dict[str, int] | None
             if batch:
@@ -287,9 +495,11 @@ class ZincConnector(BaseConnector):
                     next_cursor = {"entry_index": resource_index + 1, "line_offset": 0}
                 else:
                     next_cursor = None
-                yield IngestionPage(records=list(batch), next_cursor=next_cursor)
-                batch.clear()
-            elif processed_lines == 0:
+                yield IngestionPage.model_construct(records=batch, next_cursor=next_cursor)
+                batch = []
+            elif processed_lines == first_line:
+                # No rows were read (an empty tranche, or one shorter than the
+                # resumed offset); still advance the cursor past it.
                 if resource_index + 1 < len(resources):
                     next_cursor = {"entry_index": resource_index + 1, "line_offset": 0}
                 else:
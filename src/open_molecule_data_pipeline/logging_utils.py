@@ -16,6 +16,9 @@ class _StructlogShim:
         self._logger = logging.getLogger(name)
 
     def _log(self, level: int, event: str, **kwargs: Any) -> None:
+        # Checked up front so disabled levels return before any record is built.
+        if not self._logger.isEnabledFor(level):
+            return
         if kwargs:
             self._logger.log(level, "%s %s", event, kwargs)
         else:
@@ -5,7 +5,11 @@ from pathlib import Path
 
 import pytest
 
-from open_molecule_data_pipeline.ingestion.aria2 import Aria2Options, download_with_aria2
+from open_molecule_data_pipeline.ingestion.aria2 import (
+    Aria2Options,
+    download_many_with_aria2,
+    download_with_aria2,
+)
 
 
 def test_download_with_aria2_invokes_runner(tmp_path: Path) -> None:
@@ -70,6 +74,26 @@ def test_resume_zero_length_file(tmp_path: Path) -> None:
     assert "--continue=true" in calls[0]
 
 
+def test_resume_file_with_control_file(tmp_path: Path) -> None:
+    calls: list[list[str]] = []
+
+    def fake_runner(command: list[str]) -> None:
+        calls.append(command)
+
+    target = tmp_path / "partial.bin"
+    target.write_bytes(b"partial payload")
+    (tmp_path / "partial.bin.aria2").write_bytes(b"control")
+
+    download_with_aria2(
+        "https://example.test/archive.bin",
+        target,
+        runner=fake_runner,
+    )
+
+    assert len(calls) == 1
+    assert "--continue=true" in calls[0]
+
+
 def test_checksum_failure(tmp_path: Path) -> None:
     def failing_runner(command: list[str]) -> None:
         raise subprocess.CalledProcessError(returncode=1, cmd=command)
@@ -83,6 +107,26 @@ def test_checksum_failure(tmp_path: Path) -> None:
         )
 
 
+def test_check_integrity_only_for_existing_targets(tmp_path: Path) -> None:
+    commands: list[list[str]] = []
+
+    def fake_runner(command: list[str]) -> None:
+        commands.append(command)
+
+    existing = tmp_path / "existing.bin"
+    existing.write_bytes(b"payload")
+    for target in (tmp_path / "fresh.bin", existing):
+        download_with_aria2(
+            "https://example.test/archive.bin",
+            target,
+            checksum=("md5", "deadbeef"),
+            runner=fake_runner,
+        )
+
+    assert ["--checksum=md5=deadbeef" in command for command in commands] == [True, True]
+    assert ["--check-integrity=true" in command for command in commands] == [False, True]
+
+
 def test_authentication_arguments(tmp_path: Path) -> None:
     commands: list[list[str]] = []
 
@@ -100,3 +144,62 @@ def test_authentication_arguments(tmp_path: Path) -> None:
     assert any("--http-user" in part for part in commands[0])
     assert "user" in commands[0]
     assert "pass" in commands[0]
+
+
+def test_download_many_uses_single_input_file(tmp_path: Path) -> None:
+    commands: list[list[str]] = []
+    input_files: list[str] = []
+
+    def fake_runner(command: list[str]) -> None:
+        commands.append(command)
+        input_arg = next(part for part in command if part.startswith("--input-file="))
+        input_files.append(Path(input_arg.split("=", 1)[1]).read_text())
+
+    existing = tmp_path / "a.sdf.gz"
+    existing.write_bytes(b"payload")
+    missing = tmp_path / "nested" / "b.sdf.gz"
+
+    download_many_with_aria2(
+        [
+            ("https://example.test/a.sdf.gz", existing),
+            ("https://example.test/b.sdf.gz", missing),
+        ],
+        max_concurrent_downloads=3,
+        checksums={missing: ("md5", "abc")},
+        runner=fake_runner,
+    )
+
+    assert len(commands) == 1
+    assert "--max-concurrent-downloads=3" in commands[0]
+    assert input_files == [
+        f"https://example.test/b.sdf.gz\n  dir={missing.parent}\n  out=b.sdf.gz\n"
+        "  checksum=md5=abc\n"
+    ]
+    assert missing.parent.exists()
+
+
+def test_download_many_verifies_existing_targets_with_checksums(tmp_path: Path) -> None:
+    input_files: list[str] = []
+
+    def fake_runner(command: list[str]) -> None:
+        input_arg = next(part for part in command if part.startswith("--input-file="))
+        input_files.append(Path(input_arg.split("=", 1)[1]).read_text())
+
+    plain = tmp_path / "a.sdf.gz"
+    verified = tmp_path / "b.sdf.gz"
+    for target in (plain, verified):
+        target.write_bytes(b"payload")
+
+    download_many_with_aria2(
+        [
+            ("https://example.test/a.sdf.gz", plain),
+            ("https://example.test/b.sdf.gz", verified),
+        ],
+        checksums={verified: ("md5", "abc")},
+        runner=fake_runner,
+    )
+
+    assert input_files == [
+        f"https://example.test/b.sdf.gz\n  dir={tmp_path}\n  out=b.sdf.gz\n"
+        "  checksum=md5=abc\n  check-integrity=true\n"
+    ]
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+
+import pytest
+
+from open_molecule_data_pipeline.ingestion.chembl import ChEMBLConfig, ChEMBLConnector
+from open_molecule_data_pipeline.ingestion.common import CheckpointManager
+
+
+def _sdf_entry(chembl_id: str, smiles: str, **metadata: str) -> str:
+    lines = [
+        chembl_id,
+        "",
+        "M  END",
+        ">  <ChEMBL_ID>",
+        chembl_id,
+        "",
+        ">  <CANONICAL_SMILES>",
+        smiles,
+        "",
+    ]
+    for key, value in metadata.items():
+        lines.extend([f">  <{key}>", value, ""])
+    lines.append("$$$$")
+    return "\n".join(lines) + "\n"
+
+
+def _prepare_archives(tmp_path: Path) -> Path:
+    archives = {
+        "chembl_a.sdf.gz": _sdf_entry("CHEMBL1", "C", MW="16.04") + _sdf_entry("CHEMBL2", "CC"),
+        "chembl_b.sdf.gz": _sdf_entry("CHEMBL3", "CCC"),
+        "chembl_c.sdf.gz": _sdf_entry("CHEMBL4", "CCCC") + _sdf_entry("CHEMBL5", "CCCCC"),
+    }
+    download_dir = tmp_path / "downloads"
+    download_dir.mkdir()
+    for name, payload in archives.items():
+        (download_dir / name).write_bytes(gzip.compress(payload.encode("utf-8"), compresslevel=1))
+    link_file = tmp_path / "links.txt"
+    link_file.write_text(
+        "".join(f"https://example.test/chembl/{name}\n" for name in archives)
+    )
+    return link_file
+
+
+@pytest.mark.parametrize("parse_workers", [1, 2])
+def test_chembl_connector_batches_records(tmp_path: Path, parse_workers: int) -> None:
+    link_file = _prepare_archives(tmp_path)
+    connector = ChEMBLConnector(
+        config=ChEMBLConfig(
+            name="chembl",
+            link_file=link_file,
+            download_dir=tmp_path / "downloads",
+            batch_size=2,
+            parse_workers=parse_workers,
+        ),
+        checkpoint_manager=CheckpointManager(tmp_path / "checkpoints"),
+    )
+
+    pages = list(connector.fetch_pages())
+
+    assert [[record.identifier for record in page.records] for page in pages] == [
+        ["CHEMBL1", "CHEMBL2"],
+        ["CHEMBL3"],
+        ["CHEMBL4", "CHEMBL5"],
+    ]
+    assert pages[0].records[0].metadata == {"MW": "16.04"}
+    assert pages[0].next_cursor == {
+        "file_index": 0,
+        "file_name": "chembl_a.sdf.gz",
+        "record_offset": 2,
+    }
+
+
+def test_chembl_connector_keeps_only_configured_metadata(tmp_path: Path) -> None:
+    link_file = _prepare_archives(tmp_path)
+    (tmp_path / "downloads" / "chembl_a.sdf.gz").write_bytes(
+        gzip.compress(
+            _sdf_entry("CHEMBL1", "C", MW="16.04", ALOGP="1.1").encode("utf-8"), compresslevel=1
+        )
+    )
+    connector = ChEMBLConnector(
+        config=ChEMBLConfig(
+            name="chembl",
+            link_file=link_file,
+            download_dir=tmp_path / "downloads",
+            metadata_tags=["ALOGP", "MISSING"],
+        ),
+        checkpoint_manager=CheckpointManager(tmp_path / "checkpoints"),
+    )
+
+    first = next(connector.fetch_pages()).records[0]
+
+    assert (first.identifier, first.smiles) == ("CHEMBL1", "C")
+    assert first.metadata == {"ALOGP": "1.1"}
+
+
+def test_chembl_connector_projection_keeps_last_duplicate_tag(tmp_path: Path) -> None:
+    link_file = _prepare_archives(tmp_path)
+    payload = _sdf_entry("CHEMBL1", "C", MW="16.04").replace("$$$$", ">  < MW >\n16.05\n\n$$$$")
+    (tmp_path / "downloads" / "chembl_a.sdf.gz").write_bytes(
+        gzip.compress(
+            (payload + _sdf_entry("CHEMBL2", "CC", MW="30.07")).encode("utf-8"), compresslevel=1
+        )
+    )
+    connector = ChEMBLConnector(
+        config=ChEMBLConfig(
+            name="chembl",
+            link_file=link_file,
+            download_dir=tmp_path / "downloads",
+            metadata_tags=["MW"],
+        ),
+        checkpoint_manager=CheckpointManager(tmp_path / "checkpoints"),
+    )
+
+    records = next(connector.fetch_pages()).records
+
+    assert [record.metadata for record in records] == [{"MW": "16.05"}, {"MW": "30.07"}]
+
+
+def test_chembl_download_archives_requests_only_missing(tmp_path: Path) -> None:
+    link_file = tmp_path / "links.txt"
+    link_file.write_text(
+        "https://example.test/chembl/present.sdf.gz\n"
+        "https://example.test/chembl/missing.sdf.gz\n"
+        "https://example.test/chembl/failed.sdf.gz\n"
+    )
+    download_dir = tmp_path / "downloads"
+    download_dir.mkdir()
+    (download_dir / "present.sdf.gz").write_bytes(b"cached")
+    requested: list[list[str]] = []
+
+    def batch_downloader(downloads: list[tuple[str, Path]], **kwargs: object) -> None:
+        requested.append([url for url, _ in downloads])
+        for url, target in downloads:
+            if "missing" in url:
+                target.write_bytes(b"fetched")
+
+    connector = ChEMBLConnector(
+        config=ChEMBLConfig(name="chembl", link_file=link_file, download_dir=download_dir),
+        checkpoint_manager=CheckpointManager(tmp_path / "checkpoints"),
+        aria2_batch_downloader=batch_downloader,
+    )
+
+    downloaded = connector.download_archives()
+
+    assert requested == [
+        [
+            "https://example.test/chembl/missing.sdf.gz",
+            "https://example.test/chembl/failed.sdf.gz",
+        ]
+    ]
+    assert [path.name for path in downloaded] == ["present.sdf.gz", "missing.sdf.gz"]
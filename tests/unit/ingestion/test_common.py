@@ -3,9 +3,16 @@ from __future__ import annotations
 import gzip
 import json
 from pathlib import Path
+from types import SimpleNamespace
+from typing import BinaryIO
+
+import httpx
+import pytest
 
 from open_molecule_data_pipeline.ingestion.common import (
+    BaseHttpConnector,
     CheckpointManager,
+    HttpSourceConfig,
     IngestionCheckpoint,
     MoleculeRecord,
     NDJSONWriter,
@@ -39,3 +46,111 @@ def test_ndjson_writer_writes_gzip(tmp_path: Path) -> None:
         lines = [json.loads(line) for line in fh]
 
     assert [line["identifier"] for line in lines] == ["CID1", "CID2"]
+
+
+def test_ndjson_writer_writes_zstd(tmp_path: Path) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    writer = NDJSONWriter(tmp_path, codec="zstd")
+    records = [MoleculeRecord(source="pubchem", identifier="CID1", smiles="C")]
+
+    output = writer.write_batch("pubchem", batch_index=1, records=records)
+
+    assert output.name == "pubchem-batch-000001.jsonl.zst"
+    with zstandard.open(output, "rt", encoding="utf-8") as fh:
+        lines = [json.loads(line) for line in fh]
+    assert [line["identifier"] for line in lines] == ["CID1"]
+
+
+def test_ndjson_writer_routes_zstd_through_compressor(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    created: list[dict[str, int]] = []
+
+    class FakeCompressor:
+        def __init__(self, level: int, threads: int) -> None:
+            created.append({"level": level, "threads": threads})
+
+        def stream_writer(self, fh: BinaryIO, closefd: bool) -> BinaryIO:
+            assert closefd
+            return fh
+
+    monkeypatch.setattr(
+        "open_molecule_data_pipeline.ingestion.compression._zstd",
+        SimpleNamespace(ZstdCompressor=FakeCompressor),
+    )
+    writer = NDJSONWriter(tmp_path, compresslevel=3, codec="zstd")
+    records = [MoleculeRecord(source="pubchem", identifier="CID1", smiles="C")]
+
+    output = writer.write_batch("pubchem", batch_index=1, records=records)
+
+    assert output.name == "pubchem-batch-000001.jsonl.zst"
+    assert created == [{"level": 3, "threads": -1}]
+    lines = [json.loads(line) for line in output.read_bytes().splitlines()]
+    assert [line["identifier"] for line in lines] == ["CID1"]
+
+
+def test_http_connector_paginates_and_serializes(tmp_path: Path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("cursor") is None:
+            payload = {
+                "records": [{"id": 1, "smiles": "C", "formula": "CH4"}],
+                "next": "token-1",
+            }
+        else:
+            payload = {"records": [{"id": 2, "smiles": "CC", "formula": "C2H6"}], "next": None}
+        return httpx.Response(200, json=payload)
+
+    connector = BaseHttpConnector(
+        config=HttpSourceConfig(
+            name="api",
+            base_url="https://example.test/",
+            endpoint="/molecules",
+            metadata_fields=["formula"],
+        ),
+        checkpoint_manager=CheckpointManager(tmp_path / "checkpoints"),
+        client_factory=lambda headers: httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+    pages = list(connector.fetch_pages())
+    connector.close()
+
+    assert [page.next_cursor for page in pages] == [{"cursor": "token-1"}, None]
+    records = [record for page in pages for record in page.records]
+    assert [record.identifier for record in records] == ["1", "2"]
+    assert records[0].metadata == {"formula": "CH4"}
+
+    output = NDJSONWriter(tmp_path, compress=False).write_batch("api", 1, records)
+    lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert lines[0] == {
+        "source": "api",
+        "identifier": "1",
+        "smiles": "C",
+        "metadata": {"formula": "CH4"},
+    }
+
+
+def test_http_connector_leaves_shared_client_open(tmp_path: Path) -> None:
+    seen_headers: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers.get("apikey"))
+        return httpx.Response(200, json={"records": [], "next": None})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    connector = BaseHttpConnector(
+        config=HttpSourceConfig(
+            name="api",
+            base_url="https://example.test",
+            endpoint="molecules",
+            headers={"apikey": "secret"},
+        ),
+        checkpoint_manager=CheckpointManager(tmp_path / "checkpoints"),
+        http_client=client,
+    )
+
+    assert [page.records for page in connector.fetch_pages()] == [[]]
+    connector.close()
+
+    assert seen_headers == ["secret"]
+    assert not client.is_closed
+    client.close()
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import gzip
 import hashlib
-import io
 from pathlib import Path
 from typing import Any
 
+import pytest
+
 from open_molecule_data_pipeline.ingestion.common import (
     CheckpointManager,
     IngestionCheckpoint,
@@ -14,10 +15,7 @@ from open_molecule_data_pipeline.ingestion.pubchem import PubChemConfig, PubChem
 
 
 def _gzip_bytes(payload: str) -> bytes:
-    buffer = io.BytesIO()
-    with gzip.GzipFile(fileobj=buffer, mode="wb") as gz:
-        gz.write(payload.encode("utf-8"))
-    return buffer.getvalue()
+    return gzip.compress(payload.encode("utf-8"), compresslevel=1)
 
 
 def _sdf_entry(cid: str, smiles: str, **metadata: str) -> str:
@@ -40,7 +38,7 @@ def _sdf_entry(cid: str, smiles: str, **metadata: str) -> str:
     return "\n".join(lines) + "\n"
 
 def _write_link_file(path: Path, urls: list[str]) -> None:
-    path.write_text("\n".join(urls) + "\n")
+    path.write_bytes(("\n".join(urls) + "\n").encode("ascii"))
 
 def _build_downloader(fixtures: dict[str, bytes], checksum_suffix: str = ".md5"):
     calls: list[dict[str, Any]] = []
@@ -154,3 +152,111 @@ def test_pubchem_connector_resumes_from_checkpoint(tmp_path: Path) -> None:
 
     checksum_calls = [call for call in calls if call["url"].endswith(".md5")]
     assert checksum_calls
+
+
+def test_pubchem_download_archives_batches_checksums_then_archives(tmp_path: Path) -> None:
+    payload = _gzip_bytes(_sdf_entry("CID1", "C"))
+    md5 = hashlib.md5(payload).hexdigest()
+    urls = [
+        "https://example.test/pubchem/Cached.sdf.gz",
+        "https://example.test/pubchem/Missing.sdf.gz",
+    ]
+    link_file = tmp_path / "links.txt"
+    _write_link_file(link_file, urls)
+    download_dir = tmp_path / "downloads"
+    download_dir.mkdir()
+    (download_dir / "Cached.sdf.gz").write_bytes(payload)
+    batches: list[dict[str, Any]] = []
+
+    def batch_downloader(downloads: list[tuple[str, Path]], **kwargs: Any) -> None:
+        batches.append({"urls": [url for url, _ in downloads], **kwargs})
+        for url, target in downloads:
+            target.write_text(f"{md5}  Missing.sdf.gz\n" if url.endswith(".md5") else "x")
+
+    connector = PubChemConnector(
+        config=PubChemConfig(name="pubchem", link_file=link_file, download_dir=download_dir),
+        checkpoint_manager=CheckpointManager(tmp_path / "checkpoints"),
+        aria2_batch_downloader=batch_downloader,
+    )
+
+    downloaded = connector.download_archives()
+
+    assert [batch["urls"] for batch in batches] == [[f"{urls[1]}.md5"], [urls[1]]]
+    assert batches[1]["checksums"] == {download_dir / "Missing.sdf.gz": ("md5", md5)}
+    assert batches[1]["max_concurrent_downloads"] == 16
+    assert batches[1]["options"].connections == 8
+    assert [path.name for path in downloaded] == ["Cached.sdf.gz", "Missing.sdf.gz"]
+
+
+def test_pubchem_verify_existing_redownloads_corrupt_archives(tmp_path: Path) -> None:
+    payload = _gzip_bytes(_sdf_entry("CID1", "C"))
+    md5 = hashlib.md5(payload).hexdigest()
+    urls = [
+        "https://example.test/pubchem/Good.sdf.gz",
+        "https://example.test/pubchem/Corrupt.sdf.gz",
+    ]
+    link_file = tmp_path / "links.txt"
+    _write_link_file(link_file, urls)
+    download_dir = tmp_path / "downloads"
+    download_dir.mkdir()
+    for name, content in (("Good", payload), ("Corrupt", b"truncated")):
+        (download_dir / f"{name}.sdf.gz").write_bytes(content)
+        (download_dir / f"{name}.sdf.gz.md5").write_text(f"{md5}  {name}.sdf.gz\n")
+    requested: list[list[str]] = []
+
+    def batch_downloader(downloads: list[tuple[str, Path]], **kwargs: Any) -> None:
+        requested.append([url for url, _ in downloads])
+
+    connector = PubChemConnector(
+        config=PubChemConfig(
+            name="pubchem",
+            link_file=link_file,
+            download_dir=download_dir,
+            verify_existing=True,
+        ),
+        checkpoint_manager=CheckpointManager(tmp_path / "checkpoints"),
+        aria2_batch_downloader=batch_downloader,
+    )
+
+    connector.download_archives()
+
+    assert requested == [[urls[1]]]
+
+
+@pytest.mark.parametrize("parse_workers", [1, 2])
+def test_pubchem_connector_parses_cached_archives(tmp_path: Path, parse_workers: int) -> None:
+    download_dir = tmp_path / "downloads"
+    download_dir.mkdir()
+    archives = {
+        "Compound_A.sdf.gz": _sdf_entry("CID1", "C") + _sdf_entry("CID2", "CC"),
+        "Compound_B.sdf.gz": _sdf_entry("CID3", "CCC", PUBCHEM_IUPAC_NAME="propane"),
+    }
+    for name, payload in archives.items():
+        (download_dir / name).write_bytes(_gzip_bytes(payload))
+    link_file = tmp_path / "links.txt"
+    _write_link_file(link_file, [f"https://example.test/pubchem/{name}" for name in archives])
+
+    manager = CheckpointManager(tmp_path / "checkpoints")
+    manager.store(
+        "pubchem",
+        IngestionCheckpoint(cursor={"file_index": 0, "record_offset": 1}, batch_index=1),
+    )
+    connector = PubChemConnector(
+        config=PubChemConfig(
+            name="pubchem",
+            batch_size=2,
+            link_file=link_file,
+            download_dir=download_dir,
+            parse_workers=parse_workers,
+        ),
+        checkpoint_manager=manager,
+    )
+
+    pages = list(connector.fetch_pages())
+
+    assert [[record.identifier for record in page.records] for page in pages] == [
+        ["CID2"],
+        ["CID3"],
+    ]
+    assert pages[1].records[0].metadata == {"PUBCHEM_IUPAC_NAME": "propane"}
+    assert pages[1].next_cursor is None
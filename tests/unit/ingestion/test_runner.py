@@ -2,11 +2,10 @@ from __future__ import annotations
 
 import gzip
 import hashlib
-import io
-import json
 from pathlib import Path
 from typing import Any
 
+import orjson
 import pytest
 
 from open_molecule_data_pipeline.ingestion.runner import (
@@ -17,10 +16,7 @@ from open_molecule_data_pipeline.ingestion.runner import (
 
 
 def _gzip_bytes(payload: str) -> bytes:
-    buffer = io.BytesIO()
-    with gzip.GzipFile(fileobj=buffer, mode="wb") as gz:
-        gz.write(payload.encode("utf-8"))
-    return buffer.getvalue()
+    return gzip.compress(payload.encode("utf-8"), compresslevel=1)
 
 
 def _sdf_entry(cid: str, smiles: str) -> str:
@@ -44,7 +40,7 @@ def _sdf_entry(cid: str, smiles: str) -> str:
 
 
 def _write_link_file(path: Path, urls: list[str]) -> None:
-    path.write_text("\n".join(urls) + "\n")
+    path.write_bytes(("\n".join(urls) + "\n").encode("ascii"))
 
 
 def test_run_ingestion_writes_batches_and_checkpoints(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -66,16 +62,17 @@ def test_run_ingestion_writes_batches_and_checkpoints(tmp_path: Path, monkeypatc
         + b"  chunk_b.sdf.gz\n",
     }
 
-    def fake_downloader(url: str, output_path: Path, **kwargs: Any) -> None:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = fixtures[url]
-        if url.endswith(".md5"):
-            output_path.write_text(payload.decode("utf-8"))
-        else:
-            output_path.write_bytes(payload)
+    def fake_downloader(downloads: list[tuple[str, Path]], **kwargs: Any) -> None:
+        for url, output_path in downloads:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            payload = fixtures[url]
+            if url.endswith(".md5"):
+                output_path.write_text(payload.decode("utf-8"))
+            else:
+                output_path.write_bytes(payload)
 
     monkeypatch.setattr(
-        "open_molecule_data_pipeline.ingestion.pubchem.download_with_aria2",
+        "open_molecule_data_pipeline.ingestion.pubchem.download_many_with_aria2",
         fake_downloader,
     )
 
@@ -105,7 +102,7 @@ def test_run_ingestion_writes_batches_and_checkpoints(tmp_path: Path, monkeypatc
 
     checkpoint_path = tmp_path / "checkpoints" / "ingestion-download" / "pubchem.json"
     assert checkpoint_path.exists()
-    checkpoint = json.loads(checkpoint_path.read_text())
+    checkpoint = orjson.loads(checkpoint_path.read_bytes())
     assert checkpoint["batch_index"] == 0
     assert checkpoint["completed"] is True
 
@@ -117,8 +114,16 @@ def test_run_ingestion_writes_batches_and_checkpoints(tmp_path: Path, monkeypatc
     assert "| pubchem | pubchem | yes | 0 | 0 | 0 |" in report_contents
     assert str(tmp_path / "downloads").replace("\\", "/") in report_contents
 
-    # Running again should read from checkpoint without additional output
+    # Running again should read from checkpoint without downloading anything
+    def fail_downloader(downloads: list[tuple[str, Path]], **kwargs: Any) -> None:
+        raise AssertionError("completed source should not be downloaded again")
+
+    monkeypatch.setattr(
+        "open_molecule_data_pipeline.ingestion.pubchem.download_many_with_aria2",
+        fail_downloader,
+    )
     run_ingestion(config, mode="download")
+    assert orjson.loads(checkpoint_path.read_bytes()) == checkpoint
 
 
 def test_parse_ingestion_emits_batches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -170,18 +175,16 @@ def test_parse_ingestion_emits_batches(tmp_path: Path, monkeypatch: pytest.Monke
     second_batch = output_dir / "pubchem-batch-000002.jsonl"
 
     assert first_batch.exists()
-    with first_batch.open("r", encoding="utf-8") as fh:
-        first_lines = [json.loads(line) for line in fh]
+    first_lines = [orjson.loads(line) for line in first_batch.read_bytes().splitlines() if line]
     assert [record["identifier"] for record in first_lines] == ["CID1", "CID2"]
 
     assert second_batch.exists()
-    with second_batch.open("r", encoding="utf-8") as fh:
-        second_lines = [json.loads(line) for line in fh]
+    second_lines = [orjson.loads(line) for line in second_batch.read_bytes().splitlines() if line]
     assert [record["identifier"] for record in second_lines] == ["CID3"]
 
     checkpoint_path = tmp_path / "checkpoints" / "ingestion-parse" / "pubchem.json"
     assert checkpoint_path.exists()
-    checkpoint = json.loads(checkpoint_path.read_text())
+    checkpoint = orjson.loads(checkpoint_path.read_bytes())
     assert checkpoint["batch_index"] == 2
     assert checkpoint["completed"] is True
 
@@ -190,3 +193,131 @@ def test_parse_ingestion_emits_batches(tmp_path: Path, monkeypatch: pytest.Monke
     report_contents = report_path.read_text(encoding="utf-8")
     assert "## pubchem" in report_contents
     assert "| pubchem | pubchem | yes | 2 | 2 | 3 |" in report_contents
+
+
+def test_parse_ingestion_flushes_checkpoint_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    urls = [
+        "https://example.test/pubchem/chunk_a.sdf.gz",
+        "https://example.test/pubchem/chunk_b.sdf.gz",
+    ]
+    link_file = tmp_path / "links.txt"
+    _write_link_file(link_file, urls)
+
+    downloads_dir = tmp_path / "downloads"
+    downloads_dir.mkdir(parents=True, exist_ok=True)
+    (downloads_dir / "chunk_a.sdf.gz").write_bytes(
+        _gzip_bytes(_sdf_entry("CID1", "C") + _sdf_entry("CID2", "CC"))
+    )
+
+    config = IngestionJobConfig(
+        output_dir=tmp_path / "processed",
+        checkpoint_dir=tmp_path / "checkpoints",
+        batch_size=2,
+        checkpoint_every=8,
+        compress_output=False,
+        sources=[
+            SourceDefinition(
+                type="pubchem",
+                name="pubchem",
+                options={"link_file": link_file, "download_dir": downloads_dir},
+            )
+        ],
+    )
+
+    with pytest.raises(FileNotFoundError):
+        run_ingestion(config, mode="parse")
+
+    checkpoint_path = tmp_path / "checkpoints" / "ingestion-parse" / "pubchem.json"
+    checkpoint = orjson.loads(checkpoint_path.read_bytes())
+    assert checkpoint["batch_index"] == 1
+    assert checkpoint["cursor"] == {
+        "file_index": 0,
+        "file_name": "chunk_a.sdf.gz",
+        "record_offset": 2,
+    }
+    assert checkpoint["completed"] is False
+
+
+def test_parse_ingestion_merges_small_pages(tmp_path: Path) -> None:
+    urls = [
+        "https://example.test/pubchem/chunk_a.sdf.gz",
+        "https://example.test/pubchem/chunk_b.sdf.gz",
+    ]
+    link_file = tmp_path / "links.txt"
+    _write_link_file(link_file, urls)
+
+    downloads_dir = tmp_path / "downloads"
+    downloads_dir.mkdir(parents=True, exist_ok=True)
+    (downloads_dir / "chunk_a.sdf.gz").write_bytes(
+        _gzip_bytes(_sdf_entry("CID1", "C") + _sdf_entry("CID2", "CC"))
+    )
+    (downloads_dir / "chunk_b.sdf.gz").write_bytes(_gzip_bytes(_sdf_entry("CID3", "CCC")))
+
+    config = IngestionJobConfig(
+        output_dir=tmp_path / "processed",
+        checkpoint_dir=tmp_path / "checkpoints",
+        batch_size=2,
+        min_batch_records=3,
+        compress_output=False,
+        sources=[
+            SourceDefinition(
+                type="pubchem",
+                name="pubchem",
+                options={"link_file": link_file, "download_dir": downloads_dir},
+            )
+        ],
+    )
+
+    run_ingestion(config, mode="parse")
+
+    output_dir = tmp_path / "processed" / "pubchem"
+    batches = sorted(output_dir.glob("*.jsonl"))
+    identifiers = [
+        [orjson.loads(line)["identifier"] for line in batch.read_bytes().splitlines()]
+        for batch in batches
+    ]
+    assert identifiers == [["CID1", "CID2", "CID3"]]
+
+    checkpoint_path = tmp_path / "checkpoints" / "ingestion-parse" / "pubchem.json"
+    checkpoint = orjson.loads(checkpoint_path.read_bytes())
+    assert checkpoint["batch_index"] == 1
+    assert checkpoint["completed"] is True
+
+
+def test_parse_ingestion_runs_sources_in_processes(tmp_path: Path) -> None:
+    downloads_dir = tmp_path / "downloads"
+    downloads_dir.mkdir(parents=True, exist_ok=True)
+    sources = []
+    for name in ("pubchem_a", "pubchem_b"):
+        link_file = tmp_path / f"{name}.txt"
+        _write_link_file(link_file, [f"https://example.test/pubchem/{name}.sdf.gz"])
+        (downloads_dir / f"{name}.sdf.gz").write_bytes(
+            _gzip_bytes(_sdf_entry(f"{name}-1", "C") + _sdf_entry(f"{name}-2", "CC"))
+        )
+        sources.append(
+            SourceDefinition(
+                type="pubchem",
+                name=name,
+                options={"link_file": link_file, "download_dir": downloads_dir},
+            )
+        )
+
+    config = IngestionJobConfig(
+        output_dir=tmp_path / "processed",
+        checkpoint_dir=tmp_path / "checkpoints",
+        concurrency=2,
+        compress_output=False,
+        source_executor="process",
+        sources=sources,
+    )
+
+    run_ingestion(config, mode="parse")
+
+    for name in ("pubchem_a", "pubchem_b"):
+        checkpoint_path = tmp_path / "checkpoints" / "ingestion-parse" / f"{name}.json"
+        assert orjson.loads(checkpoint_path.read_bytes())["completed"] is True
+        batch_file = tmp_path / "processed" / name / f"{name}-batch-000001.jsonl"
+        lines = batch_file.read_bytes().splitlines()
+        assert [orjson.loads(line)["identifier"] for line in lines] == [f"{name}-1", f"{name}-2"]
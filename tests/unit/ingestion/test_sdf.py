@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from open_molecule_data_pipeline.ingestion.sdf import iter_sdf_records
+
+
+def _sdf_entry(identifier: str, smiles: str) -> str:
+    return f"{identifier}\n\nM  END\n>  <ID>\n{identifier}\n\n>  <SMILES>\n{smiles}\n\n$$$$\n"
+
+
+def test_iter_sdf_records_streams_uncompressed_file(tmp_path: Path) -> None:
+    archive = tmp_path / "records.sdf"
+    # The last record has no terminator line and must still be returned.
+    archive.write_bytes(
+        (
+            _sdf_entry("ID1", "C")
+            + _sdf_entry("ID2", "CC")
+            + _sdf_entry("ID3", "CCC").removesuffix("$$$$\n")
+        ).encode("utf-8")
+    )
+
+    records = iter_sdf_records(archive, skip=1)
+
+    assert next(records) == {"ID": "ID2", "SMILES": "CC"}
+    assert list(records) == [{"ID": "ID3", "SMILES": "CCC"}]
+
+
+def test_iter_sdf_records_handles_empty_uncompressed_file(tmp_path: Path) -> None:
+    archive = tmp_path / "empty.sdf"
+    archive.write_bytes(b"")
+
+    assert list(iter_sdf_records(archive)) == []
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gzip
 from pathlib import Path
 from typing import Any
 
@@ -14,7 +15,7 @@ from open_molecule_data_pipeline.ingestion.zinc import ZincConfig, ZincConnector
 
 def _write_text_lines(path: Path, lines: list[str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    path.write_bytes(("\n".join(lines) + "\n").encode("utf-8"))
 
 
 def _create_uri_manifest(path: Path, url: str) -> None:
@@ -66,6 +67,33 @@ def test_fetch_pages_uses_existing_archives(tmp_path: Path) -> None:
     assert second_page.next_cursor is None
 
 
+def test_fetch_pages_reads_every_gzip_member(tmp_path: Path) -> None:
+    download_dir = tmp_path / "downloads"
+    archive_path = download_dir / "2D" / "AA" / "AAAA.txt.gz"
+    archive_path.parent.mkdir(parents=True)
+    # Concatenated members, as produced by pigz or appending tranches, with a
+    # record split across the member boundary.
+    archive_path.write_bytes(
+        gzip.compress(b"C\tZINC00000001\nCC\tZINC", compresslevel=1)
+        + gzip.compress(b"00000002\r\nCCC\tZINC00000003", compresslevel=1)
+    )
+    manifest_path = tmp_path / "zinc.uri"
+    _create_uri_manifest(manifest_path, "https://irwinlab2.ucsf.edu/2D/AA/AAAA.txt.gz")
+
+    connector = ZincConnector(
+        config=ZincConfig(name="zinc", uri_file=manifest_path, download_dir=download_dir),
+        checkpoint_manager=CheckpointManager(tmp_path / "checkpoints"),
+    )
+
+    records = [record for page in connector.fetch_pages() for record in page.records]
+
+    assert [(record.smiles, record.identifier) for record in records] == [
+        ("C", "ZINC00000001"),
+        ("CC", "ZINC00000002"),
+        ("CCC", "ZINC00000003"),
+    ]
+
+
 def test_missing_archive_triggers_download(tmp_path: Path) -> None:
     manifest_path = tmp_path / "zinc.uri"
     url = "https://irwinlab2.ucsf.edu/2D/AA/AAAA.txt"
@@ -159,3 +187,115 @@ def test_fetch_pages_respects_checkpoint(tmp_path: Path) -> None:
 
     assert len(pages) == 1
     assert [record.identifier for record in pages[0].records] == ["ZINC00000003"]
+
+
+@pytest.mark.parametrize("line_offset", [3, 5])
+def test_fetch_pages_completes_when_resumed_tranche_has_no_rows(
+    tmp_path: Path, line_offset: int
+) -> None:
+    download_dir = tmp_path / "downloads"
+    _write_text_lines(
+        download_dir / "2D" / "AA" / "AAAA.txt",
+        ["C\tZINC00000001", "CC\tZINC00000002", "CCC\tZINC00000003"],
+    )
+    manifest_path = tmp_path / "zinc.uri"
+    _create_uri_manifest(manifest_path, "https://irwinlab2.ucsf.edu/2D/AA/AAAA.txt")
+    checkpoint_manager = CheckpointManager(tmp_path / "checkpoints")
+    checkpoint_manager.store(
+        "zinc",
+        IngestionCheckpoint(cursor={"entry_index": 0, "line_offset": line_offset}, batch_index=2),
+    )
+
+    connector = ZincConnector(
+        config=ZincConfig(name="zinc", uri_file=manifest_path, download_dir=download_dir),
+        checkpoint_manager=checkpoint_manager,
+    )
+    pages = list(connector.fetch_pages())
+
+    assert [(page.records, page.next_cursor) for page in pages] == [([], None)]
+
+
+@pytest.mark.parametrize("parse_workers", [1, 2])
+def test_fetch_pages_reads_tranches_in_order(tmp_path: Path, parse_workers: int) -> None:
+    download_dir = tmp_path / "downloads"
+    _write_text_lines(download_dir / "2D" / "AA" / "AAAA.txt", ["C\tZINC00000001\t1"])
+    _write_text_lines(
+        download_dir / "2D" / "AB" / "ABAA.txt", ["CC\tZINC00000002", "CCC\tZINC00000003"]
+    )
+    manifest_path = tmp_path / "zinc.uri"
+    # The last tranche is missing; earlier ones must still be yielded before the error.
+    manifest_path.write_text(
+        "https://irwinlab2.ucsf.edu/2D/AA/AAAA.txt\n"
+        "https://irwinlab2.ucsf.edu/2D/AB/ABAA.txt\n"
+        "https://irwinlab2.ucsf.edu/2D/AB/ABAB.txt\n",
+        encoding="utf-8",
+    )
+
+    connector = ZincConnector(
+        config=ZincConfig(
+            name="zinc",
+            uri_file=manifest_path,
+            download_dir=download_dir,
+            parse_workers=parse_workers,
+        ),
+        checkpoint_manager=CheckpointManager(tmp_path / "checkpoints"),
+    )
+
+    page_iter = connector.fetch_pages()
+    pages = [next(page_iter), next(page_iter)]
+    with pytest.raises(FileNotFoundError):
+        next(page_iter)
+
+    assert [[record.identifier for record in page.records] for page in pages] == [
+        ["ZINC00000001"],
+        ["ZINC00000002", "ZINC00000003"],
+    ]
+    assert pages[0].records[0].metadata == {
+        "source_file": "2D/AA/AAAA.txt",
+        "download_url": "https://irwinlab2.ucsf.edu/2D/AA/AAAA.txt",
+        "column_2": "1",
+    }
+    assert pages[0].next_cursor == {"entry_index": 1, "line_offset": 0}
+
+
+def test_download_archives_fetches_missing_tranches_in_one_batch(tmp_path: Path) -> None:
+    download_dir = tmp_path / "downloads"
+    _write_text_lines(download_dir / "2D" / "AA" / "AAAA.txt", ["C\tZINC00000001"])
+    manifest_path = tmp_path / "zinc.uri"
+    manifest_path.write_text(
+        "https://irwinlab2.ucsf.edu/2D/AA/AAAA.txt\n"
+        "https://irwinlab2.ucsf.edu/2D/AB/ABAA.txt\n"
+        "https://irwinlab2.ucsf.edu/2D/AC/ACAA.txt\n",
+        encoding="utf-8",
+    )
+    calls: list[tuple[list[str], dict[str, object]]] = []
+
+    def batch_downloader(downloads: list[tuple[str, Path]], **kwargs: object) -> None:
+        calls.append(([url for url, _ in downloads], kwargs))
+        for url, target in downloads:
+            if "AB" in url:
+                _write_text_lines(target, ["CC\tZINC00000002"])
+
+    connector = ZincConnector(
+        config=ZincConfig(
+            name="zinc",
+            uri_file=manifest_path,
+            download_dir=download_dir,
+            username="user",
+            password="pass",
+        ),
+        checkpoint_manager=CheckpointManager(tmp_path / "checkpoints"),
+        aria2_batch_downloader=batch_downloader,
+    )
+
+    downloaded = connector.download_archives()
+
+    assert len(calls) == 1
+    urls, kwargs = calls[0]
+    assert urls == [
+        "https://irwinlab2.ucsf.edu/2D/AB/ABAA.txt",
+        "https://irwinlab2.ucsf.edu/2D/AC/ACAA.txt",
+    ]
+    assert kwargs["max_concurrent_downloads"] == 16
+    assert (kwargs["username"], kwargs["password"]) == ("user", "pass")
+    assert [path.name for path in downloaded] == ["AAAA.txt", "ABAA.txt"]